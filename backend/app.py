@@ -1,4 +1,5 @@
 from flask import Flask, request, jsonify, send_from_directory, session
+from flask.json.provider import DefaultJSONProvider
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import secrets
@@ -22,6 +23,12 @@ from werkzeug.security import check_password_hash, generate_password_hash, safe_
 import threading
 from queue import Queue
 
+# orjson encodes responses much faster than stdlib json; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
@@ -144,7 +151,29 @@ elif os.path.exists('frontend/dist'):
 else:
     static_folder = os.path.abspath('../frontend/dist')  # Running from backend folder (local dev)
 logger.debug(f"Static folder: {static_folder}")
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson.
+
+    Datetimes are passed through to Flask's default handler so they keep
+    the same HTTP-date format; anything orjson can't encode falls back to
+    the stdlib provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+
 app = Flask(__name__, static_folder=static_folder)
+if orjson is not None:
+    app.json = OrjsonJSONProvider(app)
 
 # Session configuration
 app.config['SECRET_KEY'] = get_or_create_secret_key()
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, BigInteger, String, Float, Boolean, DateTime, ForeignKey, Text, text
+from sqlalchemy import create_engine, Column, Integer, BigInteger, String, Float, Boolean, DateTime, ForeignKey, Index, Text, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from datetime import datetime, timezone
@@ -57,6 +57,7 @@ class Video(Base):
     thumb_url = Column(String(500))
     file_path = Column(String(500))
     file_size_bytes = Column(Integer)
+    content_hash = Column(String(32), nullable=True, index=True)  # Quick hash of file_path's content (see quickhash)
     status = Column(String(20), default='discovered', index=True)  # discovered, queued, downloading, library, ignored, geoblocked, shorts, not_found
     watched = Column(Boolean, default=False, index=True)
     playback_seconds = Column(Integer, default=0)
@@ -108,6 +109,10 @@ class Playlist(Base):
 
 class PlaylistVideo(Base):
     __tablename__ = 'playlist_videos'
+    # A video appears in a playlist at most once; inserts use ON CONFLICT DO NOTHING
+    __table_args__ = (
+        Index('uq_playlist_videos_playlist_video', 'playlist_id', 'video_id', unique=True),
+    )
     
     id = Column(Integer, primary_key=True)
     playlist_id = Column(Integer, ForeignKey('playlists.id'), nullable=False, index=True)
@@ -210,6 +215,26 @@ def init_db(database_url=None):
             conn.execute(text("ALTER TABLE videos ADD COLUMN last_watched_at DATETIME"))
             conn.commit()
 
+        # Add content_hash column for detecting duplicate imports
+        if 'content_hash' not in video_columns:
+            conn.execute(text("ALTER TABLE videos ADD COLUMN content_hash VARCHAR(32)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_videos_content_hash ON videos (content_hash)"))
+            conn.commit()
+
+        # Enforce one row per (playlist, video), dropping duplicates from older versions first
+        result = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_playlist_videos_playlist_video'"
+        ))
+        if result.first() is None:
+            conn.execute(text(
+                "DELETE FROM playlist_videos WHERE id NOT IN "
+                "(SELECT MIN(id) FROM playlist_videos GROUP BY playlist_id, video_id)"
+            ))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX uq_playlist_videos_playlist_video ON playlist_videos (playlist_id, video_id)"
+            ))
+            conn.commit()
+
         # Add pending_playlist_name column for progressive playlist creation
         result = conn.execute(text("PRAGMA table_info(queue_items)"))
         queue_columns = [row[1] for row in result]
@@ -227,6 +252,23 @@ def init_db(database_url=None):
             session.add(Setting(key='auth_password_hash', value=generate_password_hash('admin')))
             session.add(Setting(key='first_run', value='true'))
             session.commit()
+
+        # MKV import encoding settings (see FAQ.md); added on upgrade too, without
+        # overwriting values that were already set. Defaults match routes/import_videos.py.
+        import_encode_defaults = {
+            'import_encode_hwaccel': 'false',
+            'import_encoder': 'auto',
+            'import_x264_preset': 'veryfast',
+            'import_x264_crf': '23',
+            'import_show_encode_progress': 'true',
+        }
+        existing = {key for (key,) in session.query(Setting.key).filter(
+            Setting.key.in_(list(import_encode_defaults))
+        )}
+        missing = [key for key in import_encode_defaults if key not in existing]
+        if missing:
+            session.add_all(Setting(key=key, value=import_encode_defaults[key]) for key in missing)
+            session.commit()
     finally:
         session.close()
 
@@ -1385,10 +1385,13 @@ class DownloadWorker:
                     session.add(playlist)
                     session.flush()
                     logger.info(f"Created playlist '{playlist_name}' on first completed download")
-                next_pos = len(playlist.playlist_videos)
-                pv = PlaylistVideo(playlist_id=playlist.id, video_id=video.id, position=next_pos)
-                session.add(pv)
-                logger.debug(f"Added video {video.yt_id} to playlist '{playlist_name}' (position {next_pos})")
+                if any(pv.video_id == video.id for pv in playlist.playlist_videos):
+                    logger.debug(f"Video {video.yt_id} already in playlist '{playlist_name}'")
+                else:
+                    next_pos = len(playlist.playlist_videos)
+                    pv = PlaylistVideo(playlist_id=playlist.id, video_id=video.id, position=next_pos)
+                    session.add(pv)
+                    logger.debug(f"Added video {video.yt_id} to playlist '{playlist_name}' (position {next_pos})")
 
             # Update thumb_url to local path (folder/videoId.jpg)
             folder_name = channel.folder_name if channel else (video.folder_name or 'Singles')
@@ -0,0 +1,104 @@
+"""
+Persistent cache for slow YouTube lookups (yt-dlp searches, metadata fetches).
+
+Results are stored as JSON in a small SQLite file in DATA_DIR, so they survive
+restarts and repeated import runs don't hit YouTube again. Entries are grouped
+by namespace so each kind of lookup can have its own TTL and be cleared alone.
+"""
+import json
+import logging
+import os
+import sqlite3
+import time
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = 'lookup_cache.db'
+
+
+class LookupCache:
+    """Thread-safe namespaced key/value cache backed by SQLite.
+
+    Cache failures are logged and treated as misses - a broken cache must
+    never break the lookup it sits in front of.
+    """
+
+    def __init__(self, filename=CACHE_FILENAME):
+        self.filename = filename
+        self.lock = Lock()
+        self._initialized = False
+
+    def _connect(self):
+        """Open a connection, creating the cache table on first use."""
+        data_dir = os.environ.get('DATA_DIR', 'data')
+        os.makedirs(data_dir, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(data_dir, self.filename), timeout=30)
+        if not self._initialized:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, '
+                'created_at REAL NOT NULL, PRIMARY KEY (namespace, key))'
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, namespace, key, ttl):
+        """Return the cached value, or None if missing or older than ttl seconds."""
+        try:
+            with self.lock:
+                conn = self._connect()
+                try:
+                    row = conn.execute(
+                        'SELECT value, created_at FROM cache WHERE namespace = ? AND key = ?',
+                        (namespace, key)
+                    ).fetchone()
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Lookup cache read failed ({namespace}): {e}")
+            return None
+
+        if row is None or time.time() - row[1] > ttl:
+            return None
+        return json.loads(row[0])
+
+    def set(self, namespace, key, value):
+        """Store a JSON-serializable value."""
+        try:
+            payload = json.dumps(value)
+            with self.lock:
+                conn = self._connect()
+                try:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO cache (namespace, key, value, created_at) VALUES (?, ?, ?, ?)',
+                        (namespace, key, payload, time.time())
+                    )
+                    conn.commit()
+                finally:
+                    conn.close()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug(f"Lookup cache write failed ({namespace}): {e}")
+
+    def clear(self, namespace=None):
+        """Delete all entries, or only those in one namespace. Returns rows removed."""
+        try:
+            with self.lock:
+                conn = self._connect()
+                try:
+                    if namespace is None:
+                        cursor = conn.execute('DELETE FROM cache')
+                    else:
+                        cursor = conn.execute('DELETE FROM cache WHERE namespace = ?', (namespace,))
+                    conn.commit()
+                    return cursor.rowcount
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Lookup cache clear failed: {e}")
+            return 0
+
+
+# Global cache instance shared by the import routes
+lookup_cache = LookupCache()
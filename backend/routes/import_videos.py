@@ -8,27 +8,63 @@ Endpoints:
 - GET /api/import/scan - Scan import folder for video files
 - POST /api/import/add-channel - Add a channel URL to process
 - POST /api/import/fetch-channel - Fetch video metadata from a channel
+- POST /api/import/fetch-channels - Fetch metadata for all unfetched channels in parallel
 - POST /api/import/match - Match files against channel videos
 - POST /api/import/execute - Execute import for matched files
 - POST /api/import/resolve - Resolve a pending match (user selection)
+- POST /api/import/clear-search-cache - Clear cached YouTube search results
+- POST /api/import/cache/clear - Clear cached yt-dlp lookups (all or one type)
 """
 
+import hashlib
+import heapq
 import os
 import re
-import json
 import shutil
 import subprocess
+import sys
 import logging
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from difflib import SequenceMatcher
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from flask import Blueprint, jsonify, request
-import requests as http_requests
+from queue import Empty, Queue
+from typing import Optional
+from flask import Blueprint, Response, jsonify, request
+try:
+    import fcntl  # Unix only, used for FICLONE reflinks
+except ImportError:
+    fcntl = None
 import yt_dlp
 
+# watchdog lets the import folder scan be cached until something changes;
+# without it the cache is only trusted for SCAN_CACHE_TTL seconds
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# xxhash is a much faster content hash; blake2b is the stdlib fallback
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# rapidfuzz computes title similarity in C; difflib is the pure-Python fallback
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = fuzz_process = None
+    from difflib import SequenceMatcher
+
 # Windows compatibility: find ffmpeg/ffprobe executables
 def _find_executable(name):
     """Find an executable, handling Windows .exe extension."""
@@ -61,11 +97,15 @@ def _find_executable(name):
 FFPROBE_PATH = _find_executable('ffprobe')
 FFMPEG_PATH = _find_executable('ffmpeg')
 
+from werkzeug.formparser import default_stream_factory, parse_form_data
 from werkzeug.utils import secure_filename
+from sqlalchemy import case, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from database import Video, Channel, get_session
-from utils import makedirs_777, ensure_channel_thumbnail, sanitize_folder_name
+from utils import makedirs_777, ensure_channel_thumbnail, sanitize_folder_name, save_response_atomic, thumbnail_session
 from events import queue_events
+from lookup_cache import lookup_cache
 
 logger = logging.getLogger(__name__)
 
@@ -77,51 +117,259 @@ _session_factory = None
 _settings_manager = None
 
 # Supported video extensions (browser-playable formats only)
-VIDEO_EXTENSIONS = {'.mp4', '.webm', '.m4v'}
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.webm', '.m4v'})
 MKV_EXTENSION = '.mkv'  # Handled conditionally when re-encode enabled
-
-# Import state (in-memory for session)
-_import_state = {
-    'channels': [],  # List of channel info dicts
-    'files': [],  # List of file paths
-    'pending': [],  # Files needing user selection (multiple matches)
-    'imported': [],  # Successfully imported files
-    'skipped': [],  # Skipped files with reasons
-    'failed': [],  # Failed files with detailed reasons
-    'known_channel_ids': set(),  # Channel IDs from channels.txt for prioritization
-    'current_channel_idx': 0,
-    'status': 'idle',  # idle, fetching, matching, importing, encoding, complete
-    'progress': 0,
-    'message': '',
-    'encode_progress': None,  # 0-100 when encoding MKV
-    'encode_queue': [],  # MKVs waiting to be encoded
-    'encode_current': None,  # Currently encoding file info
+_ALLOWED_WITH_MKV = VIDEO_EXTENSIONS | {MKV_EXTENSION}
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB read size when streaming uploads to disk
+CHANNEL_FETCH_WORKERS = 4  # Concurrent channel metadata fetches (network-bound)
+THUMBNAIL_WORKERS = 16  # Concurrent thumbnail downloads per import batch
+IMPORT_WORKERS = 4  # Concurrent execute_import() calls per request (copy/metadata I/O)
+
+# Match flags set on every search_video_by_title() result, fetched in one call
+_match_flags = itemgetter('channel_match', 'title_match', 'title_match_fuzzy', 'duration_match')
+# Search result sort rank (0 = best), indexed by channel<<2 | title<<1 | duration.
+# Order: all three, channel+title, channel+duration, title+duration, channel, title, duration, none
+_MATCH_RANK = (7, 6, 5, 3, 4, 2, 1, 0)
+
+# yt-dlp lookups are cached on disk (see lookup_cache.py), one namespace per kind.
+# Raw search results are cached, so title/duration scoring is re-applied per file.
+SEARCH_CACHE_NAMESPACE = 'import_search'
+SEARCH_CACHE_TTL = 7 * 24 * 3600  # 7 days
+CHANNEL_CACHE_NAMESPACE = 'import_channel'
+CHANNEL_CACHE_TTL = 24 * 3600  # 1 day - channels gain new uploads
+VIDEO_CACHE_NAMESPACE = 'import_video'
+VIDEO_CACHE_TTL = 7 * 24 * 3600  # 7 days
+RESOLVE_CACHE_NAMESPACE = 'import_resolve'
+RESOLVE_CACHE_TTL = 7 * 24 * 3600  # 7 days
+# ffprobe durations too; keyed on path + mtime + size, so edited files miss
+DURATION_CACHE_NAMESPACE = 'import_duration'
+DURATION_CACHE_TTL = 30 * 24 * 3600  # 30 days
+IMPORT_CACHE_NAMESPACES = {
+    'search': SEARCH_CACHE_NAMESPACE,
+    'channel': CHANNEL_CACHE_NAMESPACE,
+    'video': VIDEO_CACHE_NAMESPACE,
+    'resolve': RESOLVE_CACHE_NAMESPACE,
+    'duration': DURATION_CACHE_NAMESPACE,
 }
 
-# Lock for thread-safe encode queue operations
+# Searches currently running, keyed like the cache, so duplicates can share them
+_search_inflight = {}
+_search_inflight_lock = threading.Lock()
+
+# Pre-compiled patterns for channel URLs and video-ID filenames
+_CHANNEL_ID_RE = re.compile(r'/channel/(UC[a-zA-Z0-9_-]{22})')
+# Single pass over a channel URL: @handle (captured with the @), /channel/UC... ID, or /c/ and /user/ names
+_URL_RE = re.compile(
+    r'/(?:(?P<handle>@[a-zA-Z0-9_-]+)'
+    r'|channel/(?P<cid>UC[a-zA-Z0-9_-]{22})'
+    r'|(?:c|user)/(?P<custom>[a-zA-Z0-9_-]+))'
+)
+_VIDEO_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+# Windows device names, which can't be used as a file name with any extension
+_WINDOWS_DEVICE_PATTERN = r'(?i:CON|PRN|AUX|NUL|COM[0-9]|LPT[0-9]) *(?:\.|$)'
+_WINDOWS_DEVICE_RE = re.compile(_WINDOWS_DEVICE_PATTERN)
+# Upload names that are already safe to use as-is: no path parts, no leading dot,
+# no trailing dot/space, and not a Windows device name (CON.mp4, nul.mkv)
+_SAFE_FILENAME_RE = re.compile(
+    rf'(?!{_WINDOWS_DEVICE_PATTERN})[A-Za-z0-9_-](?:[A-Za-z0-9._ -]*[A-Za-z0-9_-])?'
+)
+# normalize_title passes
+_SEPARATOR_RE = re.compile(r'[_\-\.]')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+@dataclass(slots=True)
+class ImportState:
+    """Import session state (in-memory, replaced wholesale on scan/reset)."""
+    channels: list = field(default_factory=list)  # List of channel info dicts
+    channel_indexes: dict = field(default_factory=dict)  # Channel URL -> build_channel_index() of its videos
+    files: list = field(default_factory=list)  # List of file info dicts from scan
+    pending: list = field(default_factory=list)  # Files needing user selection (multiple matches)
+    imported: list = field(default_factory=list)  # Successfully imported files
+    imported_paths: set = field(default_factory=set)  # File paths in imported, kept in sync for O(1) lookups
+    pending_by_path: dict = field(default_factory=dict)  # File path -> pending item, kept in sync for O(1) lookups
+    skipped: list = field(default_factory=list)  # Skipped files with reasons
+    failed: list = field(default_factory=list)  # Failed files with detailed reasons
+    known_channel_ids: frozenset = frozenset()  # Channel IDs from channels.txt for prioritization
+    known_channel_handles: frozenset = frozenset()  # @handles from channels.txt (lowercase)
+    current_channel_idx: int = 0
+    status: str = 'idle'  # idle, fetching, matching, importing, encoding, complete
+    progress: int = 0
+    message: str = ''
+    encode_progress: Optional[int] = None  # 0-100 when encoding MKV
+    encode_current: Optional[dict] = None  # Currently encoding file info
+    include_mkv_override: bool = False  # Session-level MKV re-encode override
+
+
+_import_state = ImportState()
+
+# MKVs waiting to be encoded (module-level so it survives state resets)
+_encode_queue = Queue()
+ENCODE_IDLE_TIMEOUT = 5  # Seconds the encode worker waits for new work before exiting
+
+# Guards encode worker start/exit and encode results written to _import_state
 _encode_lock = threading.Lock()
 _encode_thread = None
 
+# Channel folders already created this import session (cleared on reset)
+_created_channel_folders = set()
+
+# Concurrent imports: one MKV conversion at a time, and one channel
+# get-or-create per YouTube channel ID (so it's never inserted twice)
+_convert_lock = threading.Lock()
+_channel_locks = defaultdict(threading.Lock)
+_channel_locks_guard = threading.Lock()
+
 
-def _ensure_state_keys():
-    """Ensure _import_state has all required keys.
+def _channel_lock(channel_id):
+    """Return the lock serializing get-or-create of one channel."""
+    with _channel_locks_guard:
+        return _channel_locks[channel_id]
 
-    This prevents KeyError when state is reset by scan endpoint
-    without the encode-related fields.
+# yt-dlp option sets, shared per thread (YoutubeDL construction loads every extractor)
+_YDL_OPTS = {
+    'flat': {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': True,  # Don't download, just get metadata
+        'ignoreerrors': True,
+        'lazy_playlist': True,  # Stop paging as soon as playlistend is reached
+        'extractor_args': {'youtubetab': {'skip': ['authcheck']}},
+    },
+    'full': {
+        'quiet': True,
+        'no_warnings': True,
+        'noplaylist': True,
+    },
+    'resolve': {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': True,
+        'playlist_items': '1',  # Just get first video to extract channel
+    },
+}
+_ydl_local = threading.local()
+
+
+def _get_cookies_file():
+    """Return cookies.txt path if it exists and is non-empty, else None."""
+    cookies_path = os.path.join(os.environ.get('DATA_DIR', '/appdata/data'), 'cookies.txt')
+    try:
+        return cookies_path if os.stat(cookies_path).st_size > 0 else None
+    except OSError:
+        return None
+
+
+def _get_ydl(kind, use_cookies=True, playlistend=None):
+    """Get this thread's reusable YoutubeDL instance for an option set.
+
+    YoutubeDL isn't thread-safe, so each worker thread keeps its own instances,
+    keyed by option set, cookie file (a new cookies.txt gets a new instance)
+    and playlistend (limits how many playlist entries are fetched).
     """
-    global _import_state
-    defaults = {
-        'encode_queue': [],
-        'encode_current': None,
-        'encode_progress': 0,
-        'failed': [],
-        'imported': [],
-        'skipped': [],
-        'pending': [],
-    }
-    for key, default in defaults.items():
-        if key not in _import_state:
-            _import_state[key] = default
+    cookiefile = _get_cookies_file() if use_cookies else None
+    instances = getattr(_ydl_local, 'instances', None)
+    if instances is None:
+        instances = _ydl_local.instances = {}
+
+    key = (kind, cookiefile, playlistend)
+    ydl = instances.get(key)
+    if ydl is None:
+        ydl_opts = dict(_YDL_OPTS[kind])
+        if cookiefile:
+            ydl_opts['cookiefile'] = cookiefile
+        if playlistend:
+            ydl_opts['playlistend'] = playlistend
+        ydl = instances[key] = yt_dlp.YoutubeDL(ydl_opts)
+    return ydl
+
+
+def _fresh_import_state(**fields):
+    """Build a new ImportState, carrying over encode data if encoding is in progress.
+
+    Returns:
+        tuple: (new ImportState, whether encoding state was preserved)
+    """
+    with _encode_lock:
+        old = _import_state
+        encoding_in_progress = old.encode_current is not None or not _encode_queue.empty()
+        if encoding_in_progress:
+            fields.update(
+                imported=old.imported,
+                imported_paths=old.imported_paths,
+                failed=old.failed,
+                status=old.status,
+                encode_progress=old.encode_progress,
+                encode_current=old.encode_current,
+            )
+    return ImportState(**fields), encoding_in_progress
+
+
+# Guards the paired list/lookup updates below, which run on request threads
+# and the encode worker alike. Taken after _encode_lock, never before it.
+_state_lock = threading.RLock()
+
+# State changes within this window are sent to SSE clients as one event
+STATE_EVENT_DELAY = 0.1
+_state_event_timer = None
+_state_event_lock = threading.Lock()
+
+
+def _notify_state_changed():
+    """Tell SSE clients the import state changed.
+
+    Bursts of changes (a batch import recording each file, a skip moving an
+    item from pending to skipped) are coalesced into a single 'import:state'
+    event sent STATE_EVENT_DELAY seconds after the first one.
+    """
+    global _state_event_timer
+    with _state_event_lock:
+        if _state_event_timer is not None:
+            return
+        _state_event_timer = threading.Timer(STATE_EVENT_DELAY, _emit_state_changed)
+        _state_event_timer.daemon = True
+        _state_event_timer.start()
+
+
+def _emit_state_changed():
+    global _state_event_timer
+    with _state_event_lock:
+        _state_event_timer = None
+    queue_events.emit('import:state')
+
+
+def _record_imported(entry):
+    """Append an entry to the imported list, keeping imported_paths in sync."""
+    with _state_lock:
+        _import_state.imported.append(entry)
+        _import_state.imported_paths.add(entry['file'])
+    _notify_state_changed()
+
+
+def _set_pending(items):
+    """Replace the pending list, keeping pending_by_path in sync."""
+    with _state_lock:
+        _import_state.pending = items
+        _import_state.pending_by_path = {item['file']: item for item in items}
+    _notify_state_changed()
+
+
+def _add_pending(items):
+    """Append to the pending list, keeping pending_by_path in sync."""
+    with _state_lock:
+        _import_state.pending.extend(items)
+        _import_state.pending_by_path.update((item['file'], item) for item in items)
+    _notify_state_changed()
+
+
+def _remove_pending(file_path):
+    """Remove a file from the pending list, keeping pending_by_path in sync."""
+    with _state_lock:
+        item = _import_state.pending_by_path.pop(file_path, None)
+        if item is not None:
+            _import_state.pending.remove(item)
+    _notify_state_changed()
 
 
 def init_import_routes(session_factory, settings_manager):
@@ -131,33 +379,64 @@ def init_import_routes(session_factory, settings_manager):
     _settings_manager = settings_manager
 
 
+def _reencode_mkv_enabled():
+    """Whether MKV re-encoding is enabled (served from SettingsManager's TTL cache)."""
+    return _settings_manager.get_bool('import_reencode_mkv')
+
+
+# Fetches the next queued encode's metadata while the current one encodes
+_encode_prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='encode-prefetch')
+
+
+def _prepare_encode_item(item):
+    """Network/probe work an encode needs before it can start (see _encode_worker)."""
+    video_info = _ensure_full_metadata(item['video'])
+    if not video_info.get('duration'):
+        _cached_duration(item['file'])  # Warms the cache the re-encode reads
+    return video_info
+
+
+def _prefetch_next_encode(prefetched):
+    """Start preparing the item at the head of the encode queue, if not already.
+
+    Args:
+        prefetched: dict of file path -> Future, owned by the encode worker
+    """
+    with _encode_queue.mutex:
+        upcoming = _encode_queue.queue[0] if _encode_queue.queue else None
+    if upcoming is not None and upcoming['file'] not in prefetched:
+        prefetched[upcoming['file']] = _encode_prefetch_executor.submit(_prepare_encode_item, upcoming)
+
+
 def _encode_worker():
-    """Background worker that processes the encode queue sequentially."""
-    global _import_state
+    """Background worker that processes the encode queue sequentially.
 
-    logger.info("Encode worker thread started")
+    Blocks on the queue between items and exits once it has been idle for
+    ENCODE_IDLE_TIMEOUT seconds. While one file encodes, the next queued
+    file's metadata is fetched in the background.
+    """
+    global _import_state, _encode_thread
 
-    _ensure_state_keys()
+    logger.info("Encode worker thread started")
+    prefetched = {}  # File path -> Future of _prepare_encode_item()
 
     while True:
-        item = None
+        try:
+            item = _encode_queue.get(timeout=ENCODE_IDLE_TIMEOUT)
+        except Empty:
+            with _encode_lock:
+                # Re-check under the lock so a concurrent _queue_for_encoding()
+                # either sees this thread exit or has its item picked up
+                if _encode_queue.empty():
+                    _encode_thread = None
+                    logger.info("Encode queue empty, worker exiting")
+                    break
+            continue
 
         with _encode_lock:
-            if not _import_state['encode_queue']:
-                # Queue empty, exit thread
-                _import_state['encode_current'] = None
-                _import_state['status'] = 'idle' if not _import_state['pending'] else 'idle'
-                logger.info("Encode queue empty, worker exiting")
-                break
-
-            # Pop next item from queue
-            item = _import_state['encode_queue'].pop(0)
-            _import_state['encode_current'] = item
-            _import_state['status'] = 'encoding'
-            _import_state['encode_progress'] = 0
-
-        if not item:
-            break
+            _import_state.encode_current = item
+            _import_state.status = 'encoding'
+            _import_state.encode_progress = 0
 
         try:
             file_path = item['file']
@@ -168,15 +447,18 @@ def _encode_worker():
 
             logger.info(f"Encode worker processing: {filename}")
 
-            # Fetch full metadata before import (gets upload_date)
-            video_info = _ensure_full_metadata(video_info)
+            # Fetch full metadata before import (gets upload_date), unless it
+            # was already prefetched during the previous encode
+            future = prefetched.pop(file_path, None)
+            video_info = future.result() if future else _prepare_encode_item(item)
+            _prefetch_next_encode(prefetched)
 
             # Execute the import (which handles MKV re-encoding)
             success, video_id = execute_import(file_path, video_info, channel_info, match_type)
 
             with _encode_lock:
                 if success:
-                    _import_state['imported'].append({
+                    _record_imported({
                         'file': file_path,
                         'filename': item.get('filename', filename),
                         'video': video_info,
@@ -184,7 +466,7 @@ def _encode_worker():
                         'channel': channel_info['channel_title'],
                     })
                 else:
-                    _import_state['failed'].append({
+                    _import_state.failed.append({
                         'file': file_path,
                         'filename': item.get('filename', filename),
                         'file_size': item.get('file_size', 0),
@@ -192,25 +474,28 @@ def _encode_worker():
                         'reason_code': 'encode_failed',
                     })
 
-            # Emit SSE after each item completes
-            queue_events.emit('import:state')
-
         except Exception as e:
             logger.error(f"Encode worker error for {item.get('filename', 'unknown')}: {e}")
             with _encode_lock:
-                _import_state['failed'].append({
+                _import_state.failed.append({
                     'file': item.get('file', ''),
                     'filename': item.get('filename', 'unknown'),
                     'file_size': item.get('file_size', 0),
                     'reason': str(e),
                     'reason_code': 'encode_error',
                 })
-            # Emit SSE on error
-            queue_events.emit('import:state')
+
+        finally:
+            with _encode_lock:
+                _import_state.encode_current = None
+                if _encode_queue.empty():
+                    _import_state.status = 'idle'
+            # Emit SSE after each item completes
+            _notify_state_changed()
 
     logger.info("Encode worker thread finished")
     # Emit final state when worker completes
-    queue_events.emit('import:state')
+    _notify_state_changed()
 
 
 def _start_encode_worker():
@@ -250,14 +535,14 @@ def _ensure_full_metadata(video_info):
 
 def _queue_for_encoding(match):
     """Add a match to the encode queue (for MKV files)."""
-    global _import_state
-
-    _ensure_state_keys()
+    _encode_queue.put(match)
+    _start_encode_worker()
 
-    with _encode_lock:
-        _import_state['encode_queue'].append(match)
 
-    _start_encode_worker()
+def _clear_encode_queue():
+    """Drop all queued encodes (the one in progress still finishes)."""
+    with _encode_queue.mutex:
+        _encode_queue.queue.clear()
 
 
 def get_downloads_folder():
@@ -287,7 +572,7 @@ def resolve_channel_id(channel_url):
 
     Handles various URL formats:
     - /channel/UCxxxxx - extract directly
-    - /@handle or /c/name - use yt-dlp to resolve
+    - /@handle or /c/name - use yt-dlp to resolve (memoized per URL)
 
     Returns channel_id or None if unable to resolve.
     """
@@ -295,48 +580,176 @@ def resolve_channel_id(channel_url):
         return None
 
     # Direct channel ID URL
-    match = re.search(r'/channel/(UC[a-zA-Z0-9_-]{22})', channel_url)
+    match = _CHANNEL_ID_RE.search(channel_url)
     if match:
         return match.group(1)
 
     # Need to resolve via yt-dlp library
     try:
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,
-            'playlist_items': '1',  # Just get first video to extract channel
-        }
-
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(f'{channel_url}/videos', download=False)
-            if info:
-                # Try to get channel_id from playlist info
-                if info.get('channel_id'):
-                    return info.get('channel_id')
-                # Or from first entry
-                if info.get('entries') and len(info['entries']) > 0:
-                    first_entry = info['entries'][0]
-                    if first_entry and first_entry.get('channel_id'):
-                        return first_entry.get('channel_id')
-
+        return _resolve_channel_id_ytdlp(channel_url)
     except Exception as e:
         logger.warning(f"Failed to resolve channel ID for {channel_url}: {e}")
 
     return None
 
 
+@lru_cache(maxsize=256)
+def _resolve_channel_id_ytdlp(channel_url):
+    """Resolve a channel URL to its channel ID via yt-dlp.
+
+    Cached per URL (in memory and on disk) so re-submitted channel lists don't
+    spin up yt-dlp again. Raises LookupError when no channel ID is found so
+    failures aren't cached.
+    """
+    cached = lookup_cache.get(RESOLVE_CACHE_NAMESPACE, channel_url, RESOLVE_CACHE_TTL)
+    if cached:
+        return cached
+
+    channel_id = None
+    ydl = _get_ydl('resolve', use_cookies=False)
+    info = ydl.extract_info(f'{channel_url}/videos', download=False)
+    if info:
+        # Try to get channel_id from playlist info
+        if info.get('channel_id'):
+            channel_id = info.get('channel_id')
+        # Or from first entry
+        elif info.get('entries') and len(info['entries']) > 0:
+            first_entry = info['entries'][0]
+            if first_entry and first_entry.get('channel_id'):
+                channel_id = first_entry.get('channel_id')
+
+    if not channel_id:
+        raise LookupError('No channel ID in yt-dlp response')
+
+    lookup_cache.set(RESOLVE_CACHE_NAMESPACE, channel_url, channel_id)
+    return channel_id
+
+
+# Last scan_import_folder() result, reused while the folder's mtime is unchanged.
+# generation is bumped by the folder watcher on every change event.
+_scan_cache = {'key': None, 'time': 0, 'result': None, 'generation': 0}
+# Guards _scan_cache: the watchdog thread invalidates it while scans read and fill it
+_scan_cache_lock = threading.Lock()
+SCAN_CACHE_TTL = 5  # Seconds; bounds staleness from in-place edits that don't touch the dir mtime
+
+# watchdog observer for the import folder (see _watch_import_folder)
+_folder_watch = {'folder': None, 'observer': None}
+_folder_watch_lock = threading.Lock()
+
+
+class _ScanCacheInvalidator(FileSystemEventHandler):
+    """Drops the cached scan whenever anything in the import folder changes."""
+
+    def on_any_event(self, event):
+        with _scan_cache_lock:
+            _scan_cache['generation'] += 1
+            _scan_cache['key'] = None
+
+
+def _watch_import_folder(import_folder):
+    """Start watching import_folder for changes, replacing any earlier watch.
+
+    Returns:
+        True if the folder is being watched (watchdog installed and working)
+    """
+    if Observer is None:
+        return False
+    with _folder_watch_lock:
+        if _folder_watch['folder'] == import_folder:
+            return True
+        if _folder_watch['observer'] is not None:
+            _folder_watch['observer'].stop()
+            _folder_watch.update(folder=None, observer=None)
+        try:
+            observer = Observer()
+            observer.schedule(_ScanCacheInvalidator(), import_folder, recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            logger.warning(f"Could not watch import folder {import_folder}: {e}")
+            return False
+        _folder_watch.update(folder=import_folder, observer=observer)
+        # Anything cached before the watch started may already be stale
+        _ScanCacheInvalidator().on_any_event(None)
+        logger.info(f"Watching import folder for changes: {import_folder}")
+        return True
+
+
+# Channel IDs/handles parsed from the channel file, keyed on its stat
+_known_channels_cache = {'key': None, 'value': None}
+
+
+def _known_channels(scan_result):
+    """Channel IDs and handles named in a scan's channel file.
+
+    Parsed once per version of the file (path, mtime, size), so repeat scans
+    of an unchanged folder skip the regex pass. Members are interned and the
+    sets frozen, so the cached sets are shared rather than copied.
+
+    Returns:
+        (frozenset of UC... channel IDs, frozenset of lowercase @handles / custom names)
+    """
+    key = None
+    if scan_result.get('channel_file'):
+        path = os.path.join(scan_result['import_path'], scan_result['channel_file'])
+        try:
+            st = os.stat(path)
+            key = (path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+    if key is not None and _known_channels_cache['key'] == key:
+        return _known_channels_cache['value']
+
+    known_channel_ids = set()  # UC... IDs
+    known_channel_handles = set()  # @handles (lowercase for comparison)
+    # One scan over all URLs; no match can span the newline separators
+    for m in _URL_RE.finditer('\n'.join(scan_result.get('csv_channels', []))):
+        kind = m.lastgroup
+        if kind == 'handle':
+            known_channel_handles.add(sys.intern(m.group('handle').lower()))
+        elif kind == 'cid':
+            known_channel_ids.add(sys.intern(m.group('cid')))
+        elif kind == 'custom':
+            known_channel_handles.add(sys.intern(m.group('custom').lower()))
+
+    value = (frozenset(known_channel_ids), frozenset(known_channel_handles))
+    if key is not None:
+        _known_channels_cache.update(key=key, value=value)
+    return value
+
+
+def _copy_scan_result(result):
+    """Copy a scan result so callers can't mutate the cached lists."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
+
 def scan_import_folder(include_mkv_override=False):
     """Scan import folder for video files and channel URL files.
 
+    Adding, removing or renaming files updates the folder's mtime, so a
+    recent result for the same mtime and MKV mode is returned without
+    listing the folder again. When watchdog is installed the folder is
+    watched, and that result is reused until a change event arrives.
+
     Args:
         include_mkv_override: If True, include MKVs regardless of setting (session override)
     """
     import_folder = get_import_folder()
 
     # Get MKV re-encode setting OR check session override
-    reencode_mkv = _settings_manager.get('import_reencode_mkv', 'false') == 'true' or include_mkv_override
-    allowed_extensions = VIDEO_EXTENSIONS | ({MKV_EXTENSION} if reencode_mkv else set())
+    reencode_mkv = _reencode_mkv_enabled() or include_mkv_override
+    allowed_extensions = _ALLOWED_WITH_MKV if reencode_mkv else VIDEO_EXTENSIONS
+
+    try:
+        cache_key = (import_folder, os.stat(import_folder).st_mtime_ns, reencode_mkv)
+    except OSError:
+        cache_key = None
+    watched = cache_key is not None and _watch_import_folder(import_folder)
+    with _scan_cache_lock:
+        if (cache_key is not None and _scan_cache['key'] == cache_key
+                and (watched or time.monotonic() - _scan_cache['time'] < SCAN_CACHE_TTL)):
+            return _copy_scan_result(_scan_cache['result'])
+        generation = _scan_cache['generation']
 
     # Accepted channel file names (one URL per line)
     CHANNEL_FILE_NAMES = {'channels.txt', 'channels.csv', 'channels.list', 'urls.txt', 'urls.csv'}
@@ -347,25 +760,30 @@ def scan_import_folder(include_mkv_override=False):
     csv_found = False
     channel_file_name = None
 
-    # Scan for video files
-    for filename in os.listdir(import_folder):
-        filepath = os.path.join(import_folder, filename)
+    # Scan for video files (DirEntry caches type/stat info from the directory read)
+    with os.scandir(import_folder) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
 
-        if os.path.isfile(filepath):
-            ext = os.path.splitext(filename)[1].lower()
+            filename = entry.name
+            filepath = entry.path
+            stem, ext = os.path.splitext(filename)
+            ext = ext.lower()
 
             if ext in allowed_extensions:
                 files.append({
                     'name': filename,
+                    'stem': stem,  # Filename without extension (video ID or title)
                     'path': filepath,
-                    'size': os.path.getsize(filepath),
+                    'size': entry.stat().st_size,
                 })
             elif ext == '.mkv' and not reencode_mkv:
                 # Track MKV files that are skipped due to re-encode setting
                 skipped_mkv.append({
                     'name': filename,
                     'path': filepath,
-                    'size': os.path.getsize(filepath),
+                    'size': entry.stat().st_size,
                     'reason': "MKV files need to be re-encoded for web playback. Go to Settings and enable 'Re-encode MKVs for web'.",
                 })
             elif filename.lower() in CHANNEL_FILE_NAMES:
@@ -378,7 +796,7 @@ def scan_import_folder(include_mkv_override=False):
                         if url and not url.startswith('#'):
                             csv_channels.append(url)
 
-    return {
+    result = {
         'files': files,
         'count': len(files),
         'skipped_mkv': skipped_mkv,
@@ -387,6 +805,12 @@ def scan_import_folder(include_mkv_override=False):
         'channel_file': channel_file_name,
         'import_path': import_folder,
     }
+    # Don't cache a listing that a change event may have raced with; the check
+    # and store happen under the lock so an invalidation can't slip in between
+    with _scan_cache_lock:
+        if _scan_cache['generation'] == generation:
+            _scan_cache.update(key=cache_key, time=time.monotonic(), result=result)
+    return _copy_scan_result(result)
 
 
 def get_video_duration(file_path):
@@ -399,22 +823,23 @@ def get_video_duration(file_path):
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             startupinfo.wShowWindow = subprocess.SW_HIDE
 
+        # Ask only for the container duration as a bare value - no JSON to parse
         result = subprocess.run([
-            FFPROBE_PATH, '-v', 'quiet', '-print_format', 'json',
-            '-show_format', file_path
+            FFPROBE_PATH, '-v', 'error', '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1', file_path
         ], capture_output=True, text=True, timeout=30, startupinfo=startupinfo)
 
         if result.returncode != 0:
             logger.warning(f"ffprobe failed for {file_path}")
             return None
 
-        data = json.loads(result.stdout)
-        duration = data.get('format', {}).get('duration')
-
-        if duration:
-            return int(float(duration))
+        try:
+            duration = float(result.stdout.strip())
+        except ValueError:
+            # ffprobe prints N/A when the container has no duration
+            return None
 
-        return None
+        return int(duration) if duration else None
     except subprocess.TimeoutExpired:
         logger.warning(f"ffprobe timeout for {file_path}")
         return None
@@ -423,68 +848,146 @@ def get_video_duration(file_path):
         return None
 
 
-def fetch_channel_videos_ytdlp(channel_url):
-    """Fetch all video metadata from a channel using yt-dlp library.
+# ffprobe results keyed by (path, mtime_ns, size) so edited/replaced files are re-probed
+_duration_cache = {}
 
-    Uses extract_flat to get metadata without downloading.
-    No API quota limits!
+
+def _cached_duration(file_path):
+    """Get video duration, reusing a previous ffprobe result for an unchanged file.
+
+    Results are kept in memory and in the lookup cache, so re-scanning the
+    import folder after a restart doesn't probe every file again.
     """
-    logger.info(f"Fetching channel metadata: {channel_url}")
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return get_video_duration(file_path)
 
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': True,
-        'ignoreerrors': True,
-    }
+    key = (file_path, st.st_mtime_ns, st.st_size)
+    duration = _duration_cache.get(key)
+    if duration is None:
+        disk_key = f"{file_path}|{st.st_mtime_ns}|{st.st_size}"
+        duration = lookup_cache.get(DURATION_CACHE_NAMESPACE, disk_key, DURATION_CACHE_TTL)
+        if duration is None:
+            duration = get_video_duration(file_path)
+            if duration is not None:
+                lookup_cache.set(DURATION_CACHE_NAMESPACE, disk_key, duration)
+        if duration is not None:
+            _duration_cache[key] = duration
+    return duration
 
-    # Add cookies if configured
-    cookies_path = os.path.join(os.environ.get('DATA_DIR', '/appdata/data'), 'cookies.txt')
-    if os.path.exists(cookies_path) and os.path.getsize(cookies_path) > 0:
-        ydl_opts['cookiefile'] = cookies_path
 
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(channel_url, download=False)
+def probe_durations(file_paths):
+    """Get durations for many files at once, running ffprobe calls concurrently.
 
-            if not info:
-                return None, "Failed to fetch channel info"
+    Each probe is a separate subprocess, so threads just overlap the waits.
 
-            videos = []
-            channel_info = None
+    Returns:
+        dict mapping file path to duration in seconds (or None)
+    """
+    if not file_paths:
+        return {}
+    workers = min(16, (os.cpu_count() or 4) * 2, len(file_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(file_paths, executor.map(_cached_duration, file_paths)))
 
-            entries = info.get('entries', [])
-            for entry in entries:
-                if not entry:
-                    continue
 
-                # Extract channel info from first video
-                if not channel_info and entry.get('channel'):
-                    channel_info = {
-                        'channel_id': entry.get('channel_id'),
-                        'channel_title': entry.get('channel'),
-                        'channel_url': channel_url,
-                    }
-
-                videos.append({
-                    'id': entry.get('id'),
-                    'title': entry.get('title'),
-                    'duration': entry.get('duration'),
-                    'upload_date': entry.get('upload_date'),
-                })
+def fetch_channel_videos_ytdlp(channel_url, max_videos=None):
+    """Fetch all video metadata from a channel using yt-dlp library.
 
-            logger.info(f"Fetched {len(videos)} videos from channel")
+    Uses extract_flat to get metadata without downloading.
+    No API quota limits! Successful fetches are cached on disk for a day.
 
-            return {
-                'channel_info': channel_info,
-                'videos': videos,
-            }, None
+    Args:
+        channel_url: Channel URL
+        max_videos: Only fetch the newest N videos (None fetches the whole channel)
+    """
+    cache_key = f"{channel_url}#{max_videos}" if max_videos else channel_url
+    cached = lookup_cache.get(CHANNEL_CACHE_NAMESPACE, cache_key, CHANNEL_CACHE_TTL)
+    if cached is not None:
+        logger.info(f"Using cached channel metadata: {channel_url} ({len(cached['videos'])} videos)")
+        return cached, None
+
+    logger.info(f"Fetching channel metadata: {channel_url}")
+
+    try:
+        ydl = _get_ydl('flat', playlistend=max_videos)
+        info = ydl.extract_info(channel_url, download=False)
+
+        if not info:
+            return None, "Failed to fetch channel info"
+
+        videos = []
+        channel_info = None
+
+        entries = info.get('entries', [])
+        for entry in entries:
+            if not entry:
+                continue
+
+            # Extract channel info from first video
+            if not channel_info and entry.get('channel'):
+                channel_info = {
+                    'channel_id': entry.get('channel_id'),
+                    'channel_title': entry.get('channel'),
+                    'channel_url': channel_url,
+                }
+
+            videos.append({
+                'id': entry.get('id'),
+                'title': entry.get('title'),
+                'duration': entry.get('duration'),
+                'upload_date': entry.get('upload_date'),
+            })
+
+        logger.info(f"Fetched {len(videos)} videos from channel")
+
+        result = {
+            'channel_info': channel_info,
+            'videos': videos,
+        }
+        # 'ignoreerrors' turns throttling/geo-blocks into empty results; don't
+        # pin those for the cache TTL, so the next fetch retries
+        if channel_info and videos:
+            lookup_cache.set(CHANNEL_CACHE_NAMESPACE, cache_key, result)
+        return result, None
 
     except Exception as e:
         logger.error(f"yt-dlp error: {e}")
         return None, str(e)
 
 
+def fetch_channels_parallel(channel_urls, max_videos=None, max_workers=CHANNEL_FETCH_WORKERS):
+    """Fetch video metadata for several channels concurrently.
+
+    Each fetch is an independent, network-bound yt-dlp call, so they overlap
+    well in threads (each thread gets its own YoutubeDL instance).
+
+    Returns:
+        dict mapping channel URL to the (result, error) tuple from fetch_channel_videos_ytdlp
+    """
+    unique_urls = list(dict.fromkeys(channel_urls))
+    results = {}
+    if not unique_urls:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+        future_to_url = {
+            executor.submit(fetch_channel_videos_ytdlp, url, max_videos): url
+            for url in unique_urls
+        }
+        for future in as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                logger.error(f"Channel fetch error for {url}: {e}")
+                results[url] = (None, str(e))
+
+    return results
+
+
+@lru_cache(maxsize=4096)
 def normalize_title(title):
     """Normalize title for comparison.
 
@@ -492,16 +995,18 @@ def normalize_title(title):
     - Convert underscores/hyphens/dots to spaces (common filename separators)
     - Remove all other special chars (!, ?, ', etc.)
     - Collapse multiple spaces
+
+    Memoized since the same channel/search titles are compared against many files.
     """
     if not title:
         return ''
     normalized = title.lower()
     # Convert common filename separators to spaces
-    normalized = re.sub(r'[_\-\.]', ' ', normalized)
+    normalized = _SEPARATOR_RE.sub(' ', normalized)
     # Remove all other special chars
-    normalized = re.sub(r'[^\w\s]', '', normalized)
+    normalized = _PUNCT_RE.sub('', normalized)
     # Collapse multiple spaces
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _WHITESPACE_RE.sub(' ', normalized)
     return normalized.strip()
 
 
@@ -523,6 +1028,34 @@ def titles_match(filename_title, video_title):
     return norm_file == norm_video
 
 
+def title_similarities(normalized_title, candidate_titles):
+    """Score one normalized title against many candidate titles at once.
+
+    With rapidfuzz the whole batch is scored in a single process.extract()
+    call instead of one Python-level comparison per candidate.
+
+    Returns:
+        list of similarity ratios (0.0-1.0), parallel to candidate_titles
+    """
+    scores = [0.0] * len(candidate_titles)
+    if not normalized_title:
+        return scores
+
+    choices = {}
+    for i, candidate in enumerate(candidate_titles):
+        normalized = normalize_title(candidate)
+        if normalized:
+            choices[i] = normalized
+
+    if fuzz_process is not None:
+        for _, score, i in fuzz_process.extract(normalized_title, choices, scorer=fuzz.ratio, limit=None):
+            scores[i] = score / 100.0
+    else:
+        for i, normalized in choices.items():
+            scores[i] = SequenceMatcher(None, normalized_title, normalized).ratio()
+    return scores
+
+
 def titles_match_fuzzy(filename_title, video_title, threshold=0.90):
     """Check if titles match with fuzzy matching (90% similarity by default).
 
@@ -543,12 +1076,23 @@ def titles_match_fuzzy(filename_title, video_title, threshold=0.90):
     if not norm_file or not norm_video:
         return False, 0.0
 
-    # Use SequenceMatcher for fuzzy comparison
-    ratio = SequenceMatcher(None, norm_file, norm_video).ratio()
+    if fuzz is not None:
+        ratio = fuzz.ratio(norm_file, norm_video) / 100.0
+    else:
+        ratio = SequenceMatcher(None, norm_file, norm_video).ratio()
 
     return ratio >= threshold, ratio
 
 
+def _best_thumbnail_url(thumbnails):
+    """Pick the best JPEG from a yt-dlp thumbnails list (sorted worst to best)."""
+    for thumb in reversed(thumbnails or []):
+        url = thumb.get('url') or ''
+        if url.split('?', 1)[0].endswith('.jpg'):
+            return url
+    return None
+
+
 def identify_video_by_id(video_id):
     """Get video metadata directly using yt-dlp library.
 
@@ -558,77 +1102,101 @@ def identify_video_by_id(video_id):
     Returns:
         dict with video info including channel, or None if not found
     """
-    logger.info(f"Looking up video by ID: {video_id}")
+    cached = lookup_cache.get(VIDEO_CACHE_NAMESPACE, video_id, VIDEO_CACHE_TTL)
+    if cached is not None:
+        logger.info(f"Using cached metadata for video ID: {video_id}")
+        return cached
 
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'noplaylist': True,
-    }
-
-    # Add cookies if available
-    cookies_path = os.path.join(os.environ.get('DATA_DIR', '/appdata/data'), 'cookies.txt')
-    if os.path.exists(cookies_path) and os.path.getsize(cookies_path) > 0:
-        ydl_opts['cookiefile'] = cookies_path
+    logger.info(f"Looking up video by ID: {video_id}")
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            url = f'https://youtube.com/watch?v={video_id}'
-            data = ydl.extract_info(url, download=False)
+        ydl = _get_ydl('full')
+        url = f'https://youtube.com/watch?v={video_id}'
+        data = ydl.extract_info(url, download=False)
 
-            if not data:
-                return None
+        if not data:
+            return None
 
-            video_id = data.get('id')
-            return {
-                'id': video_id,
-                'title': data.get('title'),
-                'duration': data.get('duration'),
-                'channel_id': data.get('channel_id'),
-                'channel_title': data.get('channel') or data.get('uploader'),
-                'channel_url': f"https://youtube.com/channel/{data.get('channel_id')}",
-                'upload_date': data.get('upload_date'),
-                'thumb_url': f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
-            }
+        video_id = data.get('id')
+        video_info = {
+            'id': video_id,
+            'title': data.get('title'),
+            'duration': data.get('duration'),
+            'channel_id': data.get('channel_id'),
+            'channel_title': data.get('channel') or data.get('uploader'),
+            'channel_url': f"https://youtube.com/channel/{data.get('channel_id')}",
+            'upload_date': data.get('upload_date'),
+            'thumb_url': (
+                _best_thumbnail_url(data.get('thumbnails'))
+                or f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+            ),
+        }
+        lookup_cache.set(VIDEO_CACHE_NAMESPACE, video_id, video_info)
+        return video_info
     except Exception as e:
         logger.error(f"Failed to identify video {video_id}: {e}")
         return None
 
 
 def _execute_youtube_search(search_query, num_results=20):
-    """Execute a YouTube search via yt-dlp library."""
-    logger.info(f"Searching YouTube for: {search_query}")
+    """Execute a YouTube search via yt-dlp library.
 
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': True,  # Don't download, just get metadata
-        'ignoreerrors': True,
-    }
+    Non-empty results are cached on disk, so re-running identification
+    doesn't repeat the same searches. Identical searches running at the
+    same time (files sharing a title) wait for one request instead of
+    each hitting YouTube.
+    """
+    cache_key = f'{num_results}:{search_query}'
+    cached = lookup_cache.get(SEARCH_CACHE_NAMESPACE, cache_key, SEARCH_CACHE_TTL)
+    if cached is not None:
+        logger.info(f"Using cached YouTube search for: {search_query}")
+        return cached
+
+    with _search_inflight_lock:
+        future = _search_inflight.get(cache_key)
+        is_owner = future is None
+        if is_owner:
+            future = _search_inflight[cache_key] = Future()
+
+    if not is_owner:
+        logger.info(f"Waiting on in-flight YouTube search for: {search_query}")
+        return future.result()
 
-    # Add cookies if available
-    cookies_path = os.path.join(os.environ.get('DATA_DIR', '/appdata/data'), 'cookies.txt')
-    if os.path.exists(cookies_path) and os.path.getsize(cookies_path) > 0:
-        ydl_opts['cookiefile'] = cookies_path
+    results = []
+    try:
+        results = _fetch_youtube_search(search_query, num_results)
+        if results:
+            lookup_cache.set(SEARCH_CACHE_NAMESPACE, cache_key, results)
+    finally:
+        with _search_inflight_lock:
+            _search_inflight.pop(cache_key, None)
+        future.set_result(results)
+
+    return results
+
+
+def _fetch_youtube_search(search_query, num_results):
+    """Run a YouTube search through yt-dlp (uncached)."""
+    logger.info(f"Searching YouTube for: {search_query}")
 
     results = []
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            search_url = f'ytsearch{num_results}:{search_query}'
-            info = ydl.extract_info(search_url, download=False)
-
-            if info and 'entries' in info:
-                for entry in info['entries']:
-                    if entry:  # Some entries might be None
-                        results.append({
-                            'id': entry.get('id'),
-                            'title': entry.get('title'),
-                            'duration': entry.get('duration'),
-                            'channel_id': entry.get('channel_id'),
-                            'channel_title': entry.get('channel') or entry.get('uploader'),
-                            'uploader_id': entry.get('uploader_id'),  # @handle
-                            'upload_date': entry.get('upload_date'),
-                        })
+        ydl = _get_ydl('flat')
+        search_url = f'ytsearch{num_results}:{search_query}'
+        info = ydl.extract_info(search_url, download=False)
+
+        if info and 'entries' in info:
+            for entry in info['entries']:
+                if entry:  # Some entries might be None
+                    results.append({
+                        'id': entry.get('id'),
+                        'title': entry.get('title'),
+                        'duration': entry.get('duration'),
+                        'channel_id': entry.get('channel_id'),
+                        'channel_title': entry.get('channel') or entry.get('uploader'),
+                        'uploader_id': entry.get('uploader_id'),  # @handle
+                        'upload_date': entry.get('upload_date'),
+                    })
     except Exception as e:
         logger.error(f"YouTube search error: {e}")
         return []
@@ -650,9 +1218,9 @@ def search_video_by_title(title, expected_duration=None, known_channel_ids=None,
         list of matching videos, best matches first
     """
     if known_channel_ids is None:
-        known_channel_ids = set()
+        known_channel_ids = frozenset()
     if known_channel_handles is None:
-        known_channel_handles = set()
+        known_channel_handles = frozenset()
     try:
         # Clean up title for search - keep most chars, just normalize separators
         # YouTube handles special chars fine, only remove things that break shell/URLs
@@ -677,9 +1245,14 @@ def search_video_by_title(title, expected_duration=None, known_channel_ids=None,
         if not raw_results:
             return []
 
+        # Fuzzy-score every result title in one batch
+        similarities = title_similarities(
+            normalized_filename, [data.get('title', '') for data in raw_results]
+        )
+
         # Process results and check both title and duration matches
         matches = []
-        for data in raw_results:
+        for data, similarity in zip(raw_results, similarities):
             video_duration = data.get('duration')
             video_title = data.get('title', '')
             normalized_video_title = normalize_title(video_title)
@@ -725,9 +1298,8 @@ def search_video_by_title(title, expected_duration=None, known_channel_ids=None,
                 logger.info(f"Title match found: '{normalized_filename}' ~ '{normalized_video_title}'")
             else:
                 # Check fuzzy title match (90%+ similarity)
-                is_fuzzy_match, similarity = titles_match_fuzzy(title, video_title)
                 match_info['title_similarity'] = similarity
-                if is_fuzzy_match:
+                if similarity >= 0.90:
                     match_info['title_match_fuzzy'] = True
                     match_info['match_type'] = 'search+title_fuzzy'
                     logger.info(f"Fuzzy title match found: '{normalized_filename}' ~ '{normalized_video_title}' ({similarity:.1%})")
@@ -753,26 +1325,12 @@ def search_video_by_title(title, expected_duration=None, known_channel_ids=None,
         # Sort priority: channel+title+duration > channel+title > channel+duration > title+duration > title > duration > other
         # Channel match is a strong signal when combined with title or duration
         def sort_key(x):
-            channel = x.get('channel_match', False)
-            title = x.get('title_match', False)
-            duration = x.get('duration_match', False)
-
-            if channel and title and duration:
-                return (0,)  # Best: all three match
-            elif channel and title:
-                return (1,)  # Channel + title
-            elif channel and duration:
-                return (2,)  # Channel + duration
-            elif title and duration:
-                return (3,)  # Title + duration (no channel)
-            elif channel:
-                return (4,)  # Channel only
-            elif title:
-                return (5,)  # Title only
-            elif duration:
-                return (6,)  # Duration only
-            else:
-                return (7,)  # No matches
+            mask = (
+                bool(x.get('channel_match')) << 2
+                | bool(x.get('title_match')) << 1
+                | bool(x.get('duration_match'))
+            )
+            return _MATCH_RANK[mask]
 
         matches.sort(key=sort_key)
 
@@ -790,69 +1348,118 @@ def search_video_by_title(title, expected_duration=None, known_channel_ids=None,
         return []
 
 
-def find_match(file_path, filename, local_duration, channel_videos):
-    """Match a file to channel videos.
+def build_channel_index(videos):
+    """Build lookup tables over a channel's videos so each file matches in O(1).
+
+    Lists keep the channel's video order, so match results come out in the
+    same order as a linear scan would produce.
+    """
+    by_duration = defaultdict(list)
+    by_title = defaultdict(list)
+    by_id = {}
+
+    for video in videos:
+        by_id.setdefault(video['id'], video)
+        if video.get('duration') is not None:
+            by_duration[video['duration']].append(video)
+        normalized = normalize_title(video.get('title', ''))
+        if normalized:
+            by_title[normalized].append(video)
+
+    return {
+        'by_duration': dict(by_duration),
+        'by_title': dict(by_title),
+        'by_id': by_id,
+    }
+
+
+def _channel_index(channel):
+    """Get the video index for a fetched channel, building it if needed."""
+    index = _import_state.channel_indexes.get(channel['url'])
+    if index is None:
+        index = build_channel_index(channel.get('videos', []))
+        _import_state.channel_indexes[channel['url']] = index
+    return index
+
+
+def find_match(file_path, filename, local_duration, index, stem=None):
+    """Match a file to channel videos using the channel's build_channel_index().
 
     Priority:
     1. Filename is video ID (11 chars, alphanumeric + dash + underscore)
     2. Title + exact duration match
     3. Exact duration only (may have multiple)
+
+    stem is the filename without its extension, when the caller already has
+    it from the folder scan.
     """
-    name = os.path.splitext(filename)[0]
+    name = stem if stem is not None else os.path.splitext(filename)[0]
 
     # Method 1: Filename is video ID (exactly 11 characters)
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', name):
-        for video in channel_videos:
-            if video['id'] == name:
-                return [video], 'id'
+    if _VIDEO_ID_RE.match(name):
+        video = index['by_id'].get(name)
+        if video is not None:
+            return [video], 'id'
         # ID format but not found in channel
         return [], 'id_not_found'
 
-    # Method 2 + 3: Title and/or duration matching
-    file_title = normalize_title(name)
-    matches = []
-
-    for video in channel_videos:
-        video_duration = video.get('duration')
-
-        # Exact duration match required
-        if video_duration is not None and local_duration is not None:
-            if video_duration == local_duration:
-                video_title = normalize_title(video.get('title', ''))
-                if file_title and video_title and file_title == video_title:
-                    matches.append((video, 'title+duration'))
-                else:
-                    matches.append((video, 'duration'))
+    # Method 2 + 3: Exact duration match required
+    if local_duration is None:
+        return [], 'no_match'
+    duration_matches = index['by_duration'].get(local_duration, [])
 
     # Prioritize title+duration matches
-    title_matches = [m for m in matches if m[1] == 'title+duration']
-    if title_matches:
-        return [m[0] for m in title_matches], 'title+duration'
+    file_title = normalize_title(name)
+    if file_title:
+        title_matches = [
+            video for video in index['by_title'].get(file_title, [])
+            if video.get('duration') == local_duration
+        ]
+        if title_matches:
+            return title_matches, 'title+duration'
 
     # Fall back to duration-only matches
-    duration_matches = [m[0] for m in matches if m[1] == 'duration']
     return duration_matches, 'duration' if duration_matches else 'no_match'
 
 
-def download_thumbnail(video_id, channel_folder):
-    """Download thumbnail for a video."""
-    thumb_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-    thumb_path = os.path.join(channel_folder, f"{video_id}.jpg")
+# Channel IDs whose thumbnail lookup already ran, so repeat imports skip the
+# network round trip. Cleared on import reset and cache clear, so a channel
+# whose thumbnail was deleted gets tried again.
+_channel_thumbnail_attempted = set()
 
+
+def download_thumbnail(video_id, channel_folder, thumb_url=None):
+    """Download thumbnail for a video, streaming it to disk.
+
+    A thumb_url already known from the yt-dlp extract is tried first, so the
+    guessed img.youtube.com URLs are only requested when it's missing or fails.
+    An existing non-empty thumbnail is kept without a request; this relies on
+    downloads going through save_response_atomic(), which never leaves a
+    partial file at thumb_path. The check is a stat every time rather than
+    an in-memory set, so a thumbnail deleted since is downloaded again.
+    """
+    thumb_path = os.path.join(channel_folder, f"{video_id}.jpg")
     try:
-        response = http_requests.get(thumb_url, timeout=10)
-        if response.status_code == 200:
-            with open(thumb_path, 'wb') as f:
-                f.write(response.content)
+        if os.stat(thumb_path).st_size > 0:
             return thumb_path
+    except OSError:
+        pass
 
-        # Try hqdefault if maxres not available
-        thumb_url = f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
-        response = http_requests.get(thumb_url, timeout=10)
-        if response.status_code == 200:
-            with open(thumb_path, 'wb') as f:
-                f.write(response.content)
-            return thumb_path
+    # Try hqdefault if maxres not available
+    candidates = [
+        f"https://img.youtube.com/vi/{video_id}/{quality}.jpg"
+        for quality in ('maxresdefault', 'hqdefault')
+    ]
+    if thumb_url and thumb_url.startswith('http') and thumb_url not in candidates:
+        candidates.insert(0, thumb_url)
+
+    try:
+        for url in candidates:
+            with thumbnail_session.get(url, timeout=10, stream=True) as response:
+                if response.status_code == 200:
+                    # Temp file + rename, so a dropped connection can't leave a truncated .jpg
+                    save_response_atomic(response, thumb_path)
+                    return thumb_path
 
     except Exception as e:
         logger.warning(f"Failed to download thumbnail for {video_id}: {e}")
@@ -860,8 +1467,23 @@ def download_thumbnail(video_id, channel_folder):
     return None
 
 
+def batch_download_thumbnails(items):
+    """Download thumbnails for several videos concurrently.
+
+    Args:
+        items: list of (video_id, channel_folder, thumb_url) tuples
+    """
+    if not items:
+        return
+    with ThreadPoolExecutor(max_workers=min(THUMBNAIL_WORKERS, len(items))) as executor:
+        list(executor.map(lambda item: download_thumbnail(*item), items))
+
+
 def _stderr_reader(pipe, error_lines):
-    """Read stderr in a thread to prevent buffer deadlock."""
+    """Read stderr in a thread to prevent buffer deadlock.
+
+    error_lines is a bounded deque, so only the tail of a long run is kept.
+    """
     try:
         for line in pipe:
             error_lines.append(line)
@@ -869,30 +1491,218 @@ def _stderr_reader(pipe, error_lines):
         pass
 
 
-def reencode_mkv_to_mp4(input_path, output_path, total_duration=None):
+# Stream codecs that play in every browser from an MP4 without re-encoding.
+# HEVC/VP9/AV1 and Opus are left to the re-encode path for Safari/iOS support.
+_REMUX_VIDEO_CODECS = frozenset({'h264'})
+_REMUX_AUDIO_CODECS = frozenset({'aac', 'mp3'})
+
+
+def _probe_stream_codecs(file_path):
+    """List (codec_type, codec_name) for every stream in a file using ffprobe."""
+    startupinfo = None
+    if os.name == 'nt':
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+
+    try:
+        result = subprocess.run([
+            FFPROBE_PATH, '-v', 'error', '-show_entries', 'stream=codec_type,codec_name',
+            '-of', 'compact=p=0', file_path
+        ], capture_output=True, text=True, timeout=30, startupinfo=startupinfo)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"ffprobe stream check failed for {file_path}: {e}")
+        return []
+
+    if result.returncode != 0:
+        return []
+
+    streams = []
+    for line in result.stdout.splitlines():
+        fields = dict(part.split('=', 1) for part in line.split('|') if '=' in part)
+        streams.append((fields.get('codec_type'), fields.get('codec_name')))
+    return streams
+
+
+def can_remux(file_path):
+    """Whether an MKV's main video and all audio can be copied into MP4 as-is."""
+    streams = _probe_stream_codecs(file_path)
+    video = [name for kind, name in streams if kind == 'video']
+    audio = [name for kind, name in streams if kind == 'audio']
+    return (
+        bool(video) and video[0] in _REMUX_VIDEO_CODECS
+        and all(name in _REMUX_AUDIO_CODECS for name in audio)
+    )
+
+
+def remux_mkv_to_mp4(input_path, output_path):
+    """Copy an MKV's streams into an MP4 container (no re-encode).
+
+    Only the first video stream and the audio streams are mapped; MKV
+    subtitle tracks and attachments (fonts) can't be stream-copied to MP4.
+    """
+    args = [
+        FFMPEG_PATH, '-y',
+        '-i', input_path,
+        '-map', '0:v:0', '-map', '0:a?',
+        '-c', 'copy',
+        '-movflags', '+faststart',
+        output_path
+    ]
+
+    startupinfo = None
+    if os.name == 'nt':
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, startupinfo=startupinfo)
+    except OSError as e:
+        logger.error(f"Remux failed: {e}")
+        return False
+
+    if result.returncode != 0:
+        logger.error(f"FFmpeg remux error (code {result.returncode}): {result.stderr[-2000:]}")
+        return False
+    return True
+
+
+# Software H.264 (libx264) settings used when no hardware encoder is
+# enabled/available; preset and CRF are tunable via settings
+X264_PRESETS = (
+    'ultrafast', 'superfast', 'veryfast', 'faster', 'fast',
+    'medium', 'slow', 'slower', 'veryslow',
+)
+DEFAULT_X264_PRESET = 'veryfast'
+DEFAULT_X264_CRF = 23
+
+
+def _software_h264_args():
+    """libx264 video args from the import_x264_preset/import_x264_crf settings."""
+    preset = _settings_manager.get('import_x264_preset', DEFAULT_X264_PRESET)
+    if preset not in X264_PRESETS:
+        logger.warning(f"Unknown x264 preset {preset!r}, using {DEFAULT_X264_PRESET}")
+        preset = DEFAULT_X264_PRESET
+    crf = min(max(_settings_manager.get_int('import_x264_crf', DEFAULT_X264_CRF), 0), 51)
+    return ['-c:v', 'libx264', '-preset', preset, '-crf', str(crf)]
+
+
+# Hardware H.264 encoders in order of preference: (name, input args, video args)
+VAAPI_DEVICE = os.environ.get('VAAPI_DEVICE', '/dev/dri/renderD128')
+_HW_H264_ENCODERS = (
+    ('h264_nvenc', [], ['-c:v', 'h264_nvenc', '-preset', 'p5', '-rc', 'vbr', '-cq', '23', '-b:v', '0', '-pix_fmt', 'yuv420p']),
+    ('h264_qsv', [], ['-c:v', 'h264_qsv', '-preset', 'medium', '-global_quality', '23']),
+    ('h264_vaapi', ['-vaapi_device', VAAPI_DEVICE], ['-vf', 'format=nv12,hwupload', '-c:v', 'h264_vaapi', '-qp', '23']),
+    ('h264_videotoolbox', [], ['-c:v', 'h264_videotoolbox', '-q:v', '65']),
+)
+
+
+@lru_cache(maxsize=1)
+def _detect_hw_encoders():
+    """Find the hardware H.264 encoders that actually work on this machine.
+
+    ffmpeg lists encoders it was built with even when there's no GPU/driver
+    for them, so each listed candidate gets a one-frame test encode. Runs
+    once per process.
+
+    Returns:
+        dict of encoder name -> (input args, video args), in preference order
+    """
+    startupinfo = None
+    if os.name == 'nt':
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+
+    try:
+        listed = subprocess.run(
+            [FFMPEG_PATH, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=15, startupinfo=startupinfo
+        ).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Could not list ffmpeg encoders: {e}")
+        return {}
+
+    encoders = {}
+    for name, input_args, video_args in _HW_H264_ENCODERS:
+        if f' {name} ' not in listed:
+            continue
+        test_args = [
+            FFMPEG_PATH, '-hide_banner', '-v', 'error', *input_args,
+            '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+            '-frames:v', '1', *video_args, '-f', 'null', '-'
+        ]
+        try:
+            result = subprocess.run(test_args, capture_output=True, timeout=30, startupinfo=startupinfo)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if result.returncode == 0:
+            encoders[name] = (input_args, video_args)
+        else:
+            logger.debug(f"Hardware encoder {name} is listed but not usable")
+
+    logger.info(f"Usable hardware H.264 encoders: {', '.join(encoders) or 'none'}")
+    return encoders
+
+
+def _video_encoder_args(hwaccel=True):
+    """ffmpeg (encoder name, input args, video args) for MKV re-encodes.
+
+    Hardware encoding is opt-in via the import_encode_hwaccel setting.
+    import_encoder picks the encoder: 'auto' (first usable hardware encoder),
+    a specific h264_* encoder, or 'libx264'. Hardware decoding (-hwaccel auto)
+    is added whenever a hardware encoder is used.
+    """
+    if hwaccel and _settings_manager.get_bool('import_encode_hwaccel'):
+        preferred = _settings_manager.get('import_encoder', 'auto')
+        if preferred != 'libx264':
+            encoders = _detect_hw_encoders()
+            if preferred in encoders:
+                name = preferred
+            else:
+                if preferred != 'auto':
+                    logger.warning(f"Encoder {preferred} is not usable, picking automatically")
+                name = next(iter(encoders), None)
+            if name:
+                input_args, video_args = encoders[name]
+                return name, ['-hwaccel', 'auto', *input_args], video_args
+    return 'libx264', [], _software_h264_args()
+
+
+def reencode_mkv_to_mp4(input_path, output_path, total_duration=None, hwaccel=True):
     """Re-encode MKV to web-compatible MP4 with progress tracking.
 
     Uses ffmpeg's -progress flag to get machine-readable progress,
-    updates _import_state with percentage for frontend polling.
+    updates _import_state with percentage for frontend polling. Without
+    a total_duration there's no percentage, so progress isn't requested.
+    A failed hardware encode is retried once with libx264.
     """
     global _import_state
 
     filename = os.path.basename(input_path)
+    encoder, input_args, video_args = _video_encoder_args(hwaccel)
+    using_hardware = encoder != 'libx264'
+    track_progress = bool(total_duration and total_duration > 0)
 
     args = [
-        FFMPEG_PATH, '-y',
+        FFMPEG_PATH, '-y', '-hide_banner',
+        '-nostats',  # Progress comes from -progress; keeps stderr to real messages
+        *input_args,
         '-i', input_path,
-        '-c:v', 'libx264',
-        '-preset', 'medium',
-        '-crf', '23',
+        *video_args,
+        '-threads', '0',  # All cores
         '-c:a', 'aac',
         '-b:a', '192k',
-        '-movflags', '+faststart',
-        '-progress', 'pipe:1',  # Machine-readable progress to stdout
+        '-movflags', '+faststart',  # moov atom up front for progressive playback
+        # Machine-readable progress to stdout
+        *(['-progress', 'pipe:1'] if track_progress else []),
         output_path
     ]
 
-    logger.info(f"Starting ffmpeg encode: {' '.join(args)}")
+    if not using_hardware:
+        encoder = f"libx264 {video_args[video_args.index('-preset') + 1]}"
+    logger.info(f"Starting ffmpeg encode ({encoder}): {' '.join(args)}")
     logger.info(f"Input duration: {total_duration}s, output: {output_path}")
 
     try:
@@ -903,218 +1713,664 @@ def reencode_mkv_to_mp4(input_path, output_path, total_duration=None):
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             startupinfo.wShowWindow = subprocess.SW_HIDE
 
-        process = subprocess.Popen(
-            args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            startupinfo=startupinfo,
-            bufsize=1  # Line buffered
-        )
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE if track_progress else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            startupinfo=startupinfo,
+            bufsize=1  # Line buffered
+        )
+
+        # Read stderr in a separate thread to prevent buffer deadlock on Windows
+        error_lines = deque(maxlen=20)  # Last 20 lines, for the error log
+        stderr_thread = threading.Thread(target=_stderr_reader, args=(process.stderr, error_lines), daemon=True)
+        stderr_thread.start()
+
+        last_percent = None
+        last_state_time = 0
+        last_log_time = 0
+        last_sse_time = 0
+        for line in (process.stdout if track_progress else ()):
+            # Only out_time_ms lines matter; the rest of the progress block is skipped
+            if not line.startswith('out_time_ms='):
+                continue
+            try:
+                current_ms = int(line[12:])
+            except ValueError:
+                continue
+
+            now = time.monotonic()
+            # ffmpeg reports several times a second; state is only polled by the UI
+            if now - last_state_time < 0.5:
+                continue
+            last_state_time = now
+
+            current_sec = current_ms / 1000000  # Microseconds to seconds
+            percent = min(99, int((current_sec / total_duration) * 100))
+            if percent != last_percent:
+                _import_state.message = f"Encoding: {filename} ({percent}%)"
+                _import_state.encode_progress = percent
+                last_percent = percent
+
+            # Emit SSE every 2 seconds for real-time progress
+            if now - last_sse_time > 2:
+                queue_events.emit('import:encode', {
+                    'filename': filename,
+                    'progress': percent,
+                    'encoding': True
+                })
+                last_sse_time = now
+
+            # Log progress every 60 seconds
+            if now - last_log_time > 60:
+                logger.info(f"Encoding progress: {filename} - {percent}% ({current_sec:.0f}s / {total_duration}s)")
+                last_log_time = now
+
+        process.wait()
+        stderr_thread.join(timeout=5)
+
+        if process.returncode != 0:
+            stderr_output = ''.join(error_lines)
+            logger.error(f"FFmpeg error (code {process.returncode}): {stderr_output}")
+            if using_hardware:
+                logger.warning(f"Hardware encode failed for {filename}, retrying with libx264")
+                return reencode_mkv_to_mp4(input_path, output_path, total_duration, hwaccel=False)
+            return False
+
+        logger.info(f"Encoding complete: {filename}")
+        _import_state.encode_progress = 100
+        return True
+
+    except Exception as e:
+        logger.error(f"Re-encoding failed: {e}")
+        return False
+
+
+def resolve_import_channels(channel_infos, downloads_folder=None):
+    """Get or create the Channel rows for a set of imports in one transaction.
+
+    Existing channels are loaded with a single query and missing ones are
+    created soft-deleted, so imported videos appear in the Library but the
+    channel doesn't show in the Channels tab. Each call holds the per-channel
+    locks, so concurrent imports never create the same channel twice.
+
+    Args:
+        channel_infos: channel_info dicts (channel_id, channel_title); repeats are fine
+
+    Returns:
+        dict mapping YouTube channel ID to (database ID, folder name)
+    """
+    infos = {info['channel_id']: info for info in channel_infos}
+    if not infos:
+        return {}
+    if downloads_folder is None:
+        downloads_folder = get_downloads_folder()
+
+    with ExitStack() as locks:
+        for yt_id in sorted(infos):  # Fixed order, so two callers can't deadlock
+            locks.enter_context(_channel_lock(yt_id))
+
+        with get_session(_session_factory) as session:
+            channels = {
+                channel.yt_id: channel
+                for channel in session.query(Channel).filter(Channel.yt_id.in_(list(infos)))
+            }
+
+            # Fetch missing channel thumbnails before writing anything, so the
+            # network requests don't run while the SQLite write lock is held.
+            # Each channel is only tried once per process, so a channel without a
+            # findable thumbnail doesn't cost a lookup for every import.
+            need_thumbnail = [
+                yt_id for yt_id in infos
+                if (yt_id not in channels or not channels[yt_id].thumbnail)
+                and yt_id not in _channel_thumbnail_attempted
+            ]
+            _channel_thumbnail_attempted.update(need_thumbnail)
+            thumb_paths = {}
+            if need_thumbnail:
+                with ThreadPoolExecutor(max_workers=min(CHANNEL_FETCH_WORKERS, len(need_thumbnail))) as executor:
+                    fetched = executor.map(
+                        lambda yt_id: ensure_channel_thumbnail(yt_id, downloads_folder), need_thumbnail
+                    )
+                    thumb_paths = {yt_id: path for yt_id, path in zip(need_thumbnail, fetched) if path}
+
+            for yt_id, info in infos.items():
+                thumb_path = thumb_paths.get(yt_id)
+                channel = channels.get(yt_id)
+                if channel is None:
+                    channel = channels[yt_id] = Channel(
+                        yt_id=yt_id,
+                        title=info['channel_title'],
+                        # Sanitize channel title for folder name (Windows-safe)
+                        folder_name=sanitize_folder_name(info['channel_title']),
+                        thumbnail=thumb_path,
+                        deleted_at=datetime.now(timezone.utc),  # Soft-delete immediately
+                    )
+                    session.add(channel)
+                    logger.info(f"Created soft-deleted channel for import: {info['channel_title']}")
+                elif thumb_path:
+                    channel.thumbnail = thumb_path
+
+                if thumb_path:
+                    logger.info(f"Downloaded channel thumbnail for {info['channel_title']}")
+
+            session.flush()  # Assign new channels' IDs; get_session commits once on exit
+            return {yt_id: (channel.id, channel.folder_name) for yt_id, channel in channels.items()}
+
+
+def execute_import(file_path, video_info, channel_info, match_type, batch=None, channels=None):
+    """Execute the import for a single file.
+
+    1. Create/get channel in database
+    2. Rename file to {video_id}.{ext}
+    3. Move (same filesystem) or copy to channel folder; MKVs that need
+       converting are remuxed/re-encoded straight into the channel folder
+    4. Download thumbnail
+    5. Add to database
+    6. Delete from import folder
+
+    When an ImportBatch is passed, steps 5-6 are deferred to batch.commit()
+    and the returned database ID is None. channels, if given, is the result
+    of resolve_import_channels() covering this file's channel.
+    """
+    global _session_factory, _import_state
+
+    video_id = video_info['id']
+    filename = os.path.basename(file_path)
+    # Lower-cased once, so .MKV is converted and the library copy gets a .mp4/.mkv name
+    ext = os.path.splitext(filename)[1].lower()
+    # Copying preserves size, so the source stat is reused for the DB record
+    # (and its device for the same-filesystem rename check)
+    source_stat = os.stat(file_path)
+    file_size = source_stat.st_size
+
+    logger.info(f"execute_import called: file_path={file_path}, video_id={video_id}, match_type={match_type}")
+
+    downloads_folder = get_downloads_folder()
+
+    # Endpoints importing many files resolve all their channels up front
+    if channels is None:
+        channels = resolve_import_channels([channel_info], downloads_folder)
+    channel_db_id, channel_folder_name = channels[channel_info['channel_id']]
+
+    # Create channel folder with proper permissions (once per session, not per file)
+    channel_folder = os.path.join(downloads_folder, channel_folder_name)
+    if channel_folder not in _created_channel_folders:
+        makedirs_777(channel_folder)
+        _created_channel_folders.add(channel_folder)
+
+    # Check if MKV needs re-encoding
+    converted_path = None
+    if ext == '.mkv':
+        reencode_enabled = _reencode_mkv_enabled()
+        include_mkv_override = _import_state.include_mkv_override
+        if reencode_enabled or include_mkv_override:
+            with _convert_lock:  # Concurrent imports convert one file at a time
+                # Output goes straight into the channel folder, so the converted
+                # file is never copied again
+                mp4_path = os.path.join(channel_folder, f"{video_id}.mp4")
+                converted = False
+
+                # Web-compatible streams only need a container change, not an encode
+                if can_remux(file_path):
+                    _import_state.status = 'remuxing'
+                    _import_state.encode_progress = None
+                    _import_state.message = f"Remuxing: {filename}"
+                    logger.info(f"Remuxing MKV to MP4 (stream copy): {filename}")
+                    converted = remux_mkv_to_mp4(file_path, mp4_path)
+                    if not converted:
+                        logger.warning(f"Remux failed for {filename}, re-encoding instead")
+
+                if not converted:
+                    # Duration is only needed for progress tracking. video_info has it
+                    # from the identify phase; otherwise the scan's ffprobe result is
+                    # reused, and nothing is probed when progress is turned off
+                    total_duration = None
+                    if _settings_manager.get_bool('import_show_encode_progress', True):
+                        total_duration = int(video_info.get('duration') or 0) or _cached_duration(file_path)
+
+                    # Set encoding state for frontend
+                    _import_state.status = 'encoding'
+                    _import_state.encode_progress = 0
+                    _import_state.message = f"Encoding: {filename} (0%)"
+                    logger.info(f"Re-encoding MKV to MP4: {filename} (duration: {total_duration}s)")
+                    converted = reencode_mkv_to_mp4(file_path, mp4_path, total_duration)
+
+                if converted:
+                    # Original MKV is removed like a copied source, after commit
+                    converted_path = mp4_path
+                    _import_state.status = 'importing'
+                    _import_state.encode_progress = None
+                    logger.info(f"MKV conversion complete: {mp4_path}")
+                else:
+                    _import_state.status = 'idle'
+                    _import_state.encode_progress = None
+                    _remove_partial_output(mp4_path)
+                    raise ValueError(f"Failed to re-encode MKV file: {filename}")
+
+    if converted_path:
+        new_file_path = converted_path
+        moved = False
+        # The MP4 is this import's output; a failed commit deletes it (the MKV stays)
+        created = True
+        # Size comes from an fstat of the file opened for hashing (portable, no pread)
+        file_size, content_hash = quickhash(converted_path)
+    else:
+        # New file path
+        new_filename = f"{video_id}{ext}"
+        new_file_path = os.path.join(channel_folder, new_filename)
+
+        # Same bytes already in the library (re-import, or a rerun after a
+        # partial failure): link to it instead of copying; the source is
+        # removed after commit like a copied one
+        _, content_hash = quickhash(file_path, file_size)
+        duplicate_path = _find_duplicate_file(file_size, content_hash)
+        moved = False
+        if duplicate_path and _link_duplicate(duplicate_path, new_file_path):
+            logger.info(f"{filename} is already in the library as {duplicate_path}, not copying")
+            # A new hard link is this import's output; the library file itself is not
+            created = os.path.abspath(duplicate_path) != os.path.abspath(new_file_path)
+        else:
+            # Same filesystem: move with a rename (no data copied). Otherwise copy now
+            # and remove the source only once the video row is committed.
+            moved = _rename_if_same_device(file_path, new_file_path, source_stat.st_dev)
+            if not moved:
+                fast_copy(file_path, new_file_path)
+            created = not moved
+
+    # Video row is written by the batch; a failed commit puts moved files back
+    own_batch = batch is None
+    if own_batch:
+        batch = ImportBatch()
+    # Thumbnail is downloaded locally with the rest of the batch's thumbnails
+    batch.add_thumbnail(video_id, channel_folder, video_info.get('thumb_url'))
+    # Rows share one transaction, so NOT NULL columns get a value here: yt-dlp can
+    # report duration (or title) as None, and one bad row would fail the whole batch
+    batch.add(file_path, {
+        'yt_id': video_id,
+        'title': video_info.get('title') or video_id,
+        'channel_id': channel_db_id,
+        'file_path': new_file_path,
+        'file_size_bytes': file_size,
+        'content_hash': content_hash,
+        'duration_sec': int(video_info.get('duration') or 0),
+        # Upload date kept as string in YYYYMMDD format
+        'upload_date': video_info.get('upload_date'),
+        # Local relative path for thumb_url (e.g., "ChannelFolder/videoId.jpg")
+        'thumb_url': f"{channel_folder_name}/{video_id}.jpg",
+    }, match_type, moved=moved, created=created)
+
+    if own_batch:
+        return True, batch.commit()[video_id]
+    return True, None
+
+
+class ImportBatch:
+    """Collects imported Video rows and writes them in a single transaction.
+
+    File copies/moves happen as each execute_import() runs; only the short DB
+    write is deferred, so the SQLite write lock isn't held across copies.
+    Copied source files are removed after commit. If it fails, moved ones are
+    renamed back and copied/linked outputs deleted, so a failed commit never
+    loses a file from the import folder or leaves a stray one in the library.
+    Thumbnails are fetched together, in parallel, just before the write.
+    """
+
+    def __init__(self):
+        self.records = []  # (source_path, video fields, match_type)
+        self.moved = set()  # Source paths that were renamed into place, not copied
+        self.created = set()  # Source paths whose output file was newly written (copy/link)
+        self.thumbnails = []  # (video_id, channel_folder, thumb_url)
+        self.lock = threading.Lock()  # add()/add_thumbnail() may run in import workers
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, source_path, fields, match_type, moved=False, created=False):
+        """Queue a Video row (fields keyed by column name) for commit()."""
+        with self.lock:
+            self.records.append((source_path, fields, match_type))
+            if moved:
+                self.moved.add(source_path)
+            if created:
+                self.created.add(source_path)
+
+    def add_thumbnail(self, video_id, channel_folder, thumb_url=None):
+        """Queue a thumbnail download for commit()."""
+        with self.lock:
+            self.thumbnails.append((video_id, channel_folder, thumb_url))
+
+    def commit(self):
+        """Write all queued rows, then remove the source files that were copied.
+
+        Returns:
+            dict mapping YouTube video ID to database Video ID
+        """
+        batch_download_thumbnails(self.thumbnails)
+        self.thumbnails = []
+
+        if not self.records:
+            return {}
+
+        try:
+            db_ids = self._write_rows()
+        except Exception:
+            self._restore_moved()
+            self._remove_created()
+            raise
+
+        for source_path, _, _ in self.records:
+            if source_path not in self.moved:
+                _remove_source_file(source_path)
+
+        self.records = []
+        self.moved = set()
+        self.created = set()
+        return db_ids
+
+    def _restore_moved(self):
+        """Rename moved files back into the import folder after a failed commit."""
+        for source_path, fields, _ in self.records:
+            if source_path in self.moved:
+                try:
+                    os.replace(fields['file_path'], source_path)
+                except OSError as e:
+                    logger.error(f"Could not move {fields['file_path']} back to {source_path}: {e}")
+
+    def _remove_created(self):
+        """Delete the copied/linked output files after a failed commit (sources are kept)."""
+        for source_path, fields, _ in self.records:
+            if source_path in self.created:
+                _remove_partial_output(fields['file_path'])
+
+    def _write_rows(self):
+        """Upsert the Video rows in one transaction. Returns {yt_id: db id}."""
+        now = datetime.now(timezone.utc)
+        rows = {}
+        for _, fields, match_type in self.records:
+            rows.setdefault(fields['yt_id'], dict(fields, status='library', downloaded_at=now))
+            logger.info(f"Imported: {fields['title']} ({fields['yt_id']}) via {match_type}")
+
+        with get_session(_session_factory) as session:
+            # One INSERT ... ON CONFLICT(yt_id) DO UPDATE for the whole batch,
+            # RETURNING the IDs of inserted and existing rows alike
+            result = session.execute(_import_upsert(), list(rows.values()))
+            return dict(result.tuples().all())
+
+
+def _import_upsert():
+    """Build the INSERT ... ON CONFLICT statement used to save imported videos.
+
+    Videos that already exist are moved into the library only if they aren't
+    there yet (SET expressions see the row's old values); ones already in the
+    library are left as they are.
+    """
+    stmt = sqlite_insert(Video)
+    excluded = stmt.excluded
+
+    def if_not_library(column, value):
+        return case((Video.status != 'library', value), else_=column)
+
+    return stmt.on_conflict_do_update(
+        index_elements=[Video.yt_id],
+        set_={
+            'status': if_not_library(Video.status, excluded.status),
+            'file_path': if_not_library(Video.file_path, excluded.file_path),
+            'file_size_bytes': if_not_library(Video.file_size_bytes, excluded.file_size_bytes),
+            'content_hash': if_not_library(Video.content_hash, excluded.content_hash),
+            'thumb_url': if_not_library(Video.thumb_url, excluded.thumb_url),
+            'downloaded_at': if_not_library(Video.downloaded_at, excluded.downloaded_at),
+            'upload_date': if_not_library(
+                Video.upload_date, func.coalesce(Video.upload_date, excluded.upload_date)
+            ),
+        },
+    ).returning(Video.yt_id, Video.id)
+
+
+QUICKHASH_CHUNK = 1024 * 1024  # Bytes hashed from each end of a file
+
+
+def quickhash(file_path, size=None):
+    """Hash the first and last QUICKHASH_CHUNK bytes of a file.
+
+    Cheap even for huge files; paired with the file size it identifies a
+    file's content well enough to spot the same video imported twice.
+
+    Returns:
+        (size, hex digest)
+    """
+    hasher = xxhash.xxh3_64() if xxhash else hashlib.blake2b(digest_size=8)
+    # seek()/read() rather than os.pread, which doesn't exist on Windows
+    with open(file_path, 'rb') as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        hasher.update(f.read(QUICKHASH_CHUNK))
+        if size > QUICKHASH_CHUNK:
+            start = max(size - QUICKHASH_CHUNK, QUICKHASH_CHUNK)
+            f.seek(start)
+            hasher.update(f.read(size - start))
+    return size, hasher.hexdigest()
+
+
+def _find_duplicate_file(size, content_hash):
+    """Path of a library file with the same size and quick hash, or None."""
+    with get_session(_session_factory) as session:
+        paths = session.query(Video.file_path).filter(
+            Video.content_hash == content_hash,
+            Video.file_size_bytes == size,
+            Video.status == 'library',
+        ).all()
+    for (path,) in paths:
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def _link_duplicate(existing_path, dst):
+    """Put an already-imported file at dst without copying it.
+
+    Returns:
+        True if dst now holds the existing file's content (it *is* dst, or
+        was hard-linked there), False if it still needs a move/copy
+    """
+    if os.path.abspath(existing_path) == os.path.abspath(dst):
+        return True
+    try:
+        if os.path.lexists(dst):
+            return False
+        os.link(existing_path, dst)
+        return True
+    except OSError as e:
+        # Different filesystem, or links not supported
+        logger.debug(f"Could not hard-link {existing_path} to {dst}: {e}")
+        return False
+
+
+def _rename_if_same_device(src, dst, src_dev=None):
+    """Move src to dst with a single rename when both are on one filesystem.
+
+    Args:
+        src_dev: st_dev of src if the caller already has it (saves a stat)
+
+    Returns:
+        True if the file was moved, False if it still needs to be copied
+    """
+    try:
+        if src_dev is None:
+            src_dev = os.stat(src).st_dev
+        if src_dev != os.stat(os.path.dirname(dst)).st_dev:
+            return False
+        os.replace(src, dst)
+        return True
+    except OSError as e:
+        # e.g. EXDEV across bind mounts that report the same device
+        logger.debug(f"Rename of {src} failed, copying instead: {e}")
+        return False
+
 
-        # Read stderr in a separate thread to prevent buffer deadlock on Windows
-        error_lines = []
-        stderr_thread = threading.Thread(target=_stderr_reader, args=(process.stderr, error_lines), daemon=True)
-        stderr_thread.start()
+# Linux FICLONE ioctl (clone file extents); fcntl only names it from Python 3.12
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409) if fcntl and sys.platform.startswith('linux') else None
 
-        last_log_time = 0
-        last_sse_time = 0
-        for line in process.stdout:
-            if line.startswith('out_time_ms='):
-                try:
-                    current_ms = int(line.split('=')[1])
-                    current_sec = current_ms / 1000000  # Microseconds to seconds
-                    if total_duration and total_duration > 0:
-                        percent = min(99, int((current_sec / total_duration) * 100))
-                        _import_state['message'] = f"Encoding: {filename} ({percent}%)"
-                        _import_state['encode_progress'] = percent
-
-                        now = time.time()
-                        # Emit SSE every 2 seconds for real-time progress
-                        if now - last_sse_time > 2:
-                            queue_events.emit('import:encode', {
-                                'filename': filename,
-                                'progress': percent,
-                                'encoding': True
-                            })
-                            last_sse_time = now
-
-                        # Log progress every 60 seconds
-                        if now - last_log_time > 60:
-                            logger.info(f"Encoding progress: {filename} - {percent}% ({current_sec:.0f}s / {total_duration}s)")
-                            last_log_time = now
-                except ValueError:
-                    pass
 
-        process.wait()
-        stderr_thread.join(timeout=5)
+COPY_BUFSIZE = 1024 * 1024  # Read size for the userspace copy fallback
 
-        if process.returncode != 0:
-            stderr_output = ''.join(error_lines[-20:])  # Last 20 lines
-            logger.error(f"FFmpeg error (code {process.returncode}): {stderr_output}")
-            return False
 
-        logger.info(f"Encoding complete: {filename}")
-        _import_state['encode_progress'] = 100
-        return True
+def _copy_readinto(fsrc, fdst, bufsize=COPY_BUFSIZE):
+    """Copy between open binary files through one reused buffer."""
+    with memoryview(bytearray(bufsize)) as mv:
+        while n := fsrc.readinto(mv):
+            fdst.write(mv[:n])
 
-    except Exception as e:
-        logger.error(f"Re-encoding failed: {e}")
-        return False
 
+def _fadvise(fd, advice):
+    """Best-effort os.posix_fadvise() over a whole file (advice is the os constant's name)."""
+    advice = getattr(os, advice, None)
+    if advice is not None:
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            pass
 
-def execute_import(file_path, video_info, channel_info, match_type):
-    """Execute the import for a single file.
 
-    1. Create/get channel in database
-    2. Rename file to {video_id}.{ext}
-    3. Copy to channel folder
-    4. Download thumbnail
-    5. Add to database
-    6. Delete from import folder
+def _sendfile_copy(src_fd, dst_fd, size):
+    """Copy size bytes from the start of src_fd to dst_fd's position with sendfile."""
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, 1 << 30))
+        if sent == 0:
+            break
+        offset += sent
+    return offset == size
+
+
+def fast_copy(src, dst):
+    """Copy a file with the cheapest mechanism the filesystem supports.
+
+    Tries, in order: a FICLONE reflink (instant copy-on-write on Btrfs/XFS),
+    os.copy_file_range (in-kernel copy, may also clone extents), os.sendfile
+    (in-kernel copy across filesystems), then shutil.copyfile where it uses
+    an OS copy (fcopyfile/CopyFileW), else a 1 MiB readinto loop. Data
+    copies hint sequential reads of the source and drop its pages from the
+    cache afterwards. File metadata is copied afterwards, like shutil.copy2.
     """
-    global _session_factory, _import_state
+    copied = False
+    if FICLONE is not None or hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            if FICLONE is not None:
+                try:
+                    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                    copied = True
+                except OSError:
+                    pass
+            if not copied:
+                size = os.fstat(src_fd).st_size
+                _fadvise(src_fd, 'POSIX_FADV_SEQUENTIAL')
+                if hasattr(os, 'copy_file_range'):
+                    try:
+                        remaining = size
+                        while remaining > 0:
+                            sent = os.copy_file_range(src_fd, dst_fd, remaining)
+                            if sent == 0:
+                                break
+                            remaining -= sent
+                        copied = remaining == 0
+                    except OSError:
+                        pass  # e.g. EXDEV across filesystems
+                if not copied and hasattr(os, 'sendfile'):
+                    # Start over in case copy_file_range got partway
+                    fdst.seek(0)
+                    fdst.truncate()
+                    try:
+                        copied = _sendfile_copy(src_fd, dst_fd, size)
+                    except OSError:
+                        pass  # copyfile below rewrites dst
+                # The source won't be read again; leave the page cache to the next file
+                _fadvise(src_fd, 'POSIX_FADV_DONTNEED')
+
+    if not copied:
+        if sys.platform.startswith('linux') or sys.platform == 'darwin' or os.name == 'nt':
+            shutil.copyfile(src, dst)
+        else:
+            # Elsewhere shutil falls back to copyfileobj with a 64 KiB buffer
+            with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb') as fdst:
+                _fadvise(fsrc.fileno(), 'POSIX_FADV_SEQUENTIAL')
+                _copy_readinto(fsrc, fdst)
+    shutil.copystat(src, dst)
+    return dst
 
-    video_id = video_info['id']
-    filename = os.path.basename(file_path)
-    ext = os.path.splitext(filename)[1]
 
-    logger.info(f"execute_import called: file_path={file_path}, video_id={video_id}, match_type={match_type}")
+def _remove_partial_output(file_path):
+    """Remove an output file left by a failed conversion or import, if any."""
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove partial output {file_path}: {e}")
 
-    # Check if MKV needs re-encoding
-    if ext.lower() == '.mkv':
-        reencode_enabled = _settings_manager.get('import_reencode_mkv', 'false') == 'true'
-        include_mkv_override = _import_state.get('include_mkv_override', False)
-        if reencode_enabled or include_mkv_override:
-            mp4_path = file_path.rsplit('.', 1)[0] + '.mp4'
-
-            # Get duration for progress tracking (video_info has it from identify phase)
-            total_duration = video_info.get('duration') or get_video_duration(file_path)
-
-            # Set encoding state for frontend
-            _import_state['status'] = 'encoding'
-            _import_state['encode_progress'] = 0
-            _import_state['message'] = f"Encoding: {filename} (0%)"
-            logger.info(f"Re-encoding MKV to MP4: {filename} (duration: {total_duration}s)")
-
-            if reencode_mkv_to_mp4(file_path, mp4_path, total_duration):
-                os.remove(file_path)  # Delete original MKV
-                file_path = mp4_path
-                ext = '.mp4'
-                _import_state['status'] = 'importing'
-                _import_state['encode_progress'] = None
-                logger.info(f"Re-encoding complete: {mp4_path}")
-            else:
-                _import_state['status'] = 'idle'
-                _import_state['encode_progress'] = None
-                raise ValueError(f"Failed to re-encode MKV file: {filename}")
 
-    with get_session(_session_factory) as session:
-        # Sanitize channel title for folder name (Windows-safe)
-        safe_title = sanitize_folder_name(channel_info['channel_title'])
-
-        # Get or create channel
-        channel = session.query(Channel).filter(
-            Channel.yt_id == channel_info['channel_id']
-        ).first()
-
-        if not channel:
-            # Create channel but immediately soft-delete it
-            # This way videos appear in Library but channel doesn't show in Channels tab
-            channel = Channel(
-                yt_id=channel_info['channel_id'],
-                title=channel_info['channel_title'],
-                folder_name=safe_title,
-                deleted_at=datetime.now(timezone.utc),  # Soft-delete immediately
-            )
-            session.add(channel)
-            session.commit()
-            logger.info(f"Created soft-deleted channel for import: {channel_info['channel_title']}")
+def _remove_source_file(file_path):
+    """Remove an imported file from the import folder."""
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            logger.info(f"Removed source file: {file_path}")
+        else:
+            logger.warning(f"Source file not found for removal: {file_path}")
+    except OSError as e:
+        logger.error(f"Failed to remove source file {file_path}: {e}")
 
-        # Ensure channel thumbnail exists
-        downloads_folder = get_downloads_folder()
-        if not channel.thumbnail:
-            thumb_path = ensure_channel_thumbnail(channel_info['channel_id'], downloads_folder)
-            if thumb_path:
-                channel.thumbnail = thumb_path
-                session.commit()
-                logger.info(f"Downloaded channel thumbnail for {channel_info['channel_title']}")
-
-        # Create channel folder with proper permissions
-        channel_folder = os.path.join(downloads_folder, channel.folder_name)
-        makedirs_777(channel_folder)
 
-        # New file path
-        new_filename = f"{video_id}{ext}"
-        new_file_path = os.path.join(channel_folder, new_filename)
+def _run_imports(import_one, jobs, max_workers=IMPORT_WORKERS):
+    """Run import_one(job) for each job in a thread pool, results in job order.
 
-        # Copy file (don't move yet - in case of error)
-        shutil.copy2(file_path, new_file_path)
-
-        # Download thumbnail locally
-        download_thumbnail(video_id, channel_folder)
-
-        # Get upload date (keep as string in YYYYMMDD format)
-        upload_date = video_info.get('upload_date')
-
-        # Store local relative path for thumb_url (e.g., "ChannelFolder/videoId.jpg")
-        thumb_url = f"{channel.folder_name}/{video_id}.jpg"
-
-        # Check if video already exists
-        existing = session.query(Video).filter(Video.yt_id == video_id).first()
-        if existing:
-            logger.warning(f"Video {video_id} already exists in database")
-            # Update to library status if not already
-            if existing.status != 'library':
-                existing.status = 'library'
-                existing.file_path = new_file_path
-                existing.file_size_bytes = os.path.getsize(new_file_path)
-                existing.thumb_url = thumb_url
-                existing.downloaded_at = datetime.now(timezone.utc)
-                if upload_date and not existing.upload_date:
-                    existing.upload_date = upload_date
-                session.commit()
-            # Remove source file
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.info(f"Removed source file: {file_path}")
-                else:
-                    logger.warning(f"Source file not found for removal: {file_path}")
-            except OSError as e:
-                logger.error(f"Failed to remove source file {file_path}: {e}")
-            return True, existing.id
-
-        # Create video record
-        video = Video(
-            yt_id=video_id,
-            title=video_info['title'],
-            channel_id=channel.id,
-            status='library',
-            file_path=new_file_path,
-            file_size_bytes=os.path.getsize(new_file_path),
-            duration_sec=video_info.get('duration', 0),
-            upload_date=upload_date,
-            thumb_url=thumb_url,
-            downloaded_at=datetime.now(timezone.utc),
-        )
+    Copies, renames and metadata fetches of different files overlap; the DB
+    write still happens once, when the shared ImportBatch is committed.
+    import_one must handle its own errors.
+    """
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        return list(executor.map(import_one, jobs))
 
-        session.add(video)
-        session.commit()
 
-        # Remove source file from import folder
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"Removed source file: {file_path}")
-            else:
-                logger.warning(f"Source file not found for removal: {file_path}")
-        except OSError as e:
-            logger.error(f"Failed to remove source file {file_path}: {e}")
+def _prefetch_import_channels(channel_infos):
+    """resolve_import_channels() for all of a request's files at once.
 
-        logger.info(f"Imported: {video_info['title']} ({video_id}) via {match_type}")
+    Returns None if that fails, so each file falls back to resolving (and
+    reporting errors for) its own channel.
+    """
+    if not channel_infos:
+        return None
+    try:
+        return resolve_import_channels(channel_infos)
+    except Exception as e:
+        logger.error(f"Could not resolve channels for import: {e}")
+        return None
+
+
+def _commit_import_batch(batch, batched):
+    """Commit an ImportBatch and finalize the results of the imports in it.
+
+    Args:
+        batch: ImportBatch the imports were added to
+        batched: list of (result dict, imported entry) pairs for those imports
+    """
+    try:
+        db_ids = batch.commit()
+    except Exception as e:
+        logger.error(f"Import batch commit failed: {e}")
+        for result, _ in batched:
+            result['success'] = False
+            result['error'] = str(e)
+            result.pop('video_id', None)
+        return
 
-        return True, video.id
+    for result, entry in batched:
+        result['video_id'] = db_ids.get(entry['video']['id'])
+        _record_imported(entry)
 
 
 # =============================================================================
@@ -1137,59 +2393,59 @@ def scan_folder():
 
     # Extract channel identifiers from URLs (handles, IDs, custom names)
     # We'll match against these when checking search results
-    known_channel_ids = set()  # UC... IDs
-    known_channel_handles = set()  # @handles (lowercase for comparison)
+    known_channel_ids, known_channel_handles = _known_channels(result)
+
+    logger.info(f"Found {len(known_channel_ids)} channel IDs and {len(known_channel_handles)} handles from {len(result.get('csv_channels', []))} URLs")
 
-    for url in result.get('csv_channels', []):
-        url_lower = url.lower()
-        # Extract @handle
-        handle_match = re.search(r'/@([a-zA-Z0-9_-]+)', url)
-        if handle_match:
-            known_channel_handles.add('@' + handle_match.group(1).lower())
+    # Reset import state but preserve encoding data
+    _import_state, _ = _fresh_import_state(
+        files=result['files'],
+        known_channel_ids=known_channel_ids,
+        known_channel_handles=known_channel_handles,
+        include_mkv_override=include_mkv_override,  # Session-level MKV re-encode override
+    )
 
-        # Extract channel ID
-        id_match = re.search(r'/channel/(UC[a-zA-Z0-9_-]{22})', url)
-        if id_match:
-            known_channel_ids.add(id_match.group(1))
+    return jsonify(result)
 
-        # Extract /c/name or /user/name
-        c_match = re.search(r'/(?:c|user)/([a-zA-Z0-9_-]+)', url)
-        if c_match:
-            known_channel_handles.add(c_match.group(1).lower())
 
-    logger.info(f"Found {len(known_channel_ids)} channel IDs and {len(known_channel_handles)} handles from {len(result.get('csv_channels', []))} URLs")
+def _create_unique_file(folder, filename, max_attempts=10000):
+    """Create a new file in folder without clobbering an existing one.
 
-    # Preserve encoding state if encoding is in progress
-    with _encode_lock:
-        encoding_in_progress = _import_state.get('encode_current') is not None or len(_import_state.get('encode_queue', [])) > 0
-        preserved_encode_queue = _import_state.get('encode_queue', []) if encoding_in_progress else []
-        preserved_encode_current = _import_state.get('encode_current') if encoding_in_progress else None
-        preserved_encode_progress = _import_state.get('encode_progress', 0) if encoding_in_progress else None
-        preserved_imported = _import_state.get('imported', []) if encoding_in_progress else []
-        preserved_failed = _import_state.get('failed', []) if encoding_in_progress else []
-        preserved_status = _import_state.get('status', 'idle') if encoding_in_progress else 'idle'
+    Uses O_CREAT|O_EXCL so the existence check and creation are a single
+    atomic syscall, which is also safe against concurrent uploads.
 
-    # Reset import state but preserve encoding data
-    _import_state = {
-        'channels': [],
-        'files': result['files'],
-        'pending': [],
-        'imported': preserved_imported,
-        'skipped': [],
-        'failed': preserved_failed,
-        'known_channel_ids': known_channel_ids,
-        'known_channel_handles': known_channel_handles,
-        'current_channel_idx': 0,
-        'status': preserved_status,
-        'progress': 0,
-        'message': '',
-        'encode_progress': preserved_encode_progress,
-        'encode_queue': preserved_encode_queue,
-        'encode_current': preserved_encode_current,
-        'include_mkv_override': include_mkv_override,  # Session-level MKV re-encode override
-    }
+    Returns:
+        tuple: (fd, filename, path) for the file that was created
+    """
+    base, ext = os.path.splitext(filename)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
 
-    return jsonify(result)
+    for counter in range(max_attempts):
+        candidate = filename if counter == 0 else f"{base}_{counter}{ext}"
+        path = os.path.join(folder, candidate)
+        try:
+            return os.open(path, flags, 0o666), candidate, path
+        except FileExistsError:
+            continue
+
+    raise FileExistsError(f"No free filename for {filename} after {max_attempts} attempts")
+
+
+def _upload_filename(filename, ext):
+    """Safe name to store an upload under.
+
+    Plain ASCII names are kept as-is (including spaces, which
+    secure_filename() would turn into underscores); anything else goes
+    through secure_filename(), with a nanosecond-timestamped fallback for
+    names it strips entirely (e.g. non-ASCII). Windows device names get a
+    leading underscore on every OS, since the import folder is often shared.
+    """
+    if _SAFE_FILENAME_RE.fullmatch(filename):
+        return filename
+    name = secure_filename(filename)
+    if name and _WINDOWS_DEVICE_RE.match(name):
+        name = f'_{name}'
+    return name or f'upload_{time.time_ns()}{ext}'
 
 
 @import_bp.route('/api/import/upload', methods=['POST'])
@@ -1198,21 +2454,57 @@ def upload_import_file():
 
     Accepts multipart form data with a 'file' field.
     Returns the saved filename and size.
+
+    The multipart body is parsed here with a stream factory that writes an
+    acceptable file part straight into the import folder, instead of
+    Werkzeug spooling it to a temporary file that is then copied again.
     """
-    if 'file' not in request.files:
-        return jsonify({'error': 'No file provided'}), 400
+    # Get MKV re-encode setting
+    reencode_mkv = _reencode_mkv_enabled()
+    allowed_extensions = _ALLOWED_WITH_MKV if reencode_mkv else VIDEO_EXTENSIONS
+    import_folder = get_import_folder()
+    claimed = {}  # 'filename', 'path', 'stream' of the file created by stream_factory
+
+    def stream_factory(total_content_length, content_type, filename, content_length=None):
+        ext = os.path.splitext(filename or '')[1].lower()
+        if claimed or ext not in allowed_extensions:
+            return default_stream_factory(total_content_length, content_type, filename, content_length)
+        # Atomically claim a free filename (appends _1, _2, ... on duplicates)
+        fd, name, path = _create_unique_file(import_folder, _upload_filename(filename, ext))
+        claimed.update(filename=name, path=path, stream=os.fdopen(fd, 'wb'))
+        return claimed['stream']
+
+    try:
+        _, _, files = parse_form_data(
+            request.environ,
+            stream_factory=stream_factory,
+            max_content_length=request.max_content_length,
+            max_form_memory_size=request.max_form_memory_size,
+            max_form_parts=request.max_form_parts,
+        )
+    except Exception as e:
+        if claimed:
+            claimed['stream'].close()
+            _remove_partial_output(claimed['path'])
+        logger.error(f"Failed to save uploaded file: {e}")
+        return jsonify({'error': f'Failed to save file: {str(e)}'}), 500
+
+    file = files.get('file')
+    if claimed and (file is None or file.stream is not claimed['stream']):
+        # The claimed part was some other field; drop it
+        claimed['stream'].close()
+        _remove_partial_output(claimed['path'])
+        claimed.clear()
 
-    file = request.files['file']
+    if file is None:
+        return jsonify({'error': 'No file provided'}), 400
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
 
-    # Get MKV re-encode setting
-    reencode_mkv = _settings_manager.get('import_reencode_mkv', 'false') == 'true'
-    allowed_extensions = VIDEO_EXTENSIONS | ({MKV_EXTENSION} if reencode_mkv else set())
-
     # Check extension
     ext = os.path.splitext(file.filename)[1].lower()
     if ext not in allowed_extensions:
+        file.close()
         # Specific message for MKV files
         if ext == '.mkv':
             return jsonify({
@@ -1222,30 +2514,24 @@ def upload_import_file():
             'error': f'Invalid file type: {ext}. Supported: {", ".join(sorted(allowed_extensions))}'
         }), 400
 
-    # Save to import folder
-    import_folder = get_import_folder()
-    safe_filename_str = secure_filename(file.filename)
-
-    # If secure_filename strips everything (e.g., non-ASCII), use a fallback
-    if not safe_filename_str:
-        safe_filename_str = f'upload_{datetime.now().strftime("%Y%m%d_%H%M%S")}{ext}'
-
-    filepath = os.path.join(import_folder, safe_filename_str)
-
-    # Handle duplicate filenames
-    base, file_ext = os.path.splitext(safe_filename_str)
-    counter = 1
-    while os.path.exists(filepath):
-        safe_filename_str = f"{base}_{counter}{file_ext}"
-        filepath = os.path.join(import_folder, safe_filename_str)
-        counter += 1
-
     try:
-        file.save(filepath)
+        if claimed:
+            # Already on disk in the import folder; its size is the written length
+            with file.stream as out:
+                file_size = os.fstat(out.fileno()).st_size
+            filepath = claimed['path']
+            safe_filename_str = claimed['filename']
+        else:
+            # Another part took the direct write, so this one was spooled; copy it out
+            fd, safe_filename_str, filepath = _create_unique_file(
+                import_folder, _upload_filename(file.filename, ext)
+            )
+            with os.fdopen(fd, 'wb') as out, file.stream as src:
+                shutil.copyfileobj(src, out, UPLOAD_CHUNK_SIZE)
+                file_size = out.tell()
         # Set permissions (Unix only - no-op on Windows)
         if os.name != 'nt':
             os.chmod(filepath, 0o777)
-        file_size = os.path.getsize(filepath)
         logger.info(f"Uploaded file to import folder: {safe_filename_str} ({file_size} bytes)")
 
         return jsonify({
@@ -1258,21 +2544,25 @@ def upload_import_file():
         return jsonify({'error': f'Failed to save file: {str(e)}'}), 500
 
 
-def _process_single_file(file_info, mode, known_channel_ids, known_channel_handles):
+def _process_single_file(file_info, mode, known_channel_ids, known_channel_handles, local_duration=None):
     """Process a single file for identification (used by ThreadPoolExecutor).
 
+    local_duration may be passed in from a probe_durations() pre-pass;
+    otherwise the file is probed here.
+
     Returns a dict with 'type' (identified/pending/failed) and the result data.
     """
     file_path = file_info['path']
     filename = file_info['name']
     file_size = file_info.get('size', 0)
-    name_without_ext = os.path.splitext(filename)[0]
+    name_without_ext = file_info.get('stem') or os.path.splitext(filename)[0]
 
     # Get local file duration
-    local_duration = get_video_duration(file_path)
+    if local_duration is None:
+        local_duration = _cached_duration(file_path)
 
     # Method 1: Filename is video ID (11 chars)
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', name_without_ext):
+    if _VIDEO_ID_RE.match(name_without_ext):
         logger.info(f"Identifying by video ID: {name_without_ext}")
         video_info = identify_video_by_id(name_without_ext)
 
@@ -1331,9 +2621,20 @@ def _process_single_file(file_info, mode, known_channel_ids, known_channel_handl
 
     logger.info(f"Got {len(search_results)} search results")
 
-    # Check for matches
-    channel_title_duration = [r for r in search_results if r.get('channel_match') and r.get('title_match') and r.get('duration_match')]
-    title_duration = [r for r in search_results if r.get('title_match') and r.get('duration_match')]
+    # Categorize matches in a single pass over the results
+    channel_title_duration = []
+    title_duration = []
+    viable_matches = []  # Duration + fuzzy title, offered for user review
+    for r in search_results:
+        channel_match, title_match, title_match_fuzzy, duration_match = _match_flags(r)
+        if not duration_match:
+            continue
+        if title_match_fuzzy:
+            viable_matches.append(r)
+        if title_match:
+            title_duration.append(r)
+            if channel_match:
+                channel_title_duration.append(r)
 
     # Determine if we should auto-import based on mode
     best_match = None
@@ -1369,10 +2670,11 @@ def _process_single_file(file_info, mode, known_channel_ids, known_channel_handl
         }
     else:
         # Need user review
-        viable_matches = [r for r in search_results if r.get('duration_match') and r.get('title_match_fuzzy')]
-
         if viable_matches:
-            viable_matches.sort(key=lambda x: (x.get('duration_diff', 999), -x.get('title_similarity', 0)))
+            # Only the best few are offered; nsmallest keeps the sort's order for those
+            top_matches = heapq.nsmallest(
+                5, viable_matches, key=lambda x: (x.get('duration_diff', 999), -x.get('title_similarity', 0))
+            )
             logger.info(f"PENDING: '{filename}' - {mode} mode, {len(viable_matches)} viable options")
             return {
                 'type': 'pending',
@@ -1380,7 +2682,7 @@ def _process_single_file(file_info, mode, known_channel_ids, known_channel_handl
                     'file': file_path,
                     'filename': filename,
                     'file_size': file_size,
-                    'matches': viable_matches[:5],
+                    'matches': top_matches,
                     'match_type': 'multiple',
                     'local_duration': local_duration,
                 }
@@ -1427,7 +2729,8 @@ def smart_identify():
     """Identify videos directly without scanning channels.
 
     This is MUCH faster than channel-by-channel scanning.
-    Uses yt-dlp with PARALLEL lookups (3 at a time) to either:
+    Uses yt-dlp with PARALLEL lookups (import_identify_workers setting,
+    default 3, max 8) to either:
     1. Get video info directly (if filename is video ID)
     2. Search YouTube by title and match by duration
 
@@ -1444,64 +2747,79 @@ def smart_identify():
     mode = data.get('mode', 'auto')  # 'auto' or 'manual'
     logger.info(f"Smart identify starting in {mode.upper()} mode with PARALLEL processing")
 
-    if not _import_state['files']:
+    if not _import_state.files:
         return jsonify({'error': 'No files to identify. Run scan first.'}), 400
 
     identified = []
     pending = []
     failed = []
 
-    known_channel_ids = _import_state.get('known_channel_ids', set())
-    known_channel_handles = _import_state.get('known_channel_handles', set())
+    known_channel_ids = _import_state.known_channel_ids
+    known_channel_handles = _import_state.known_channel_handles
     logger.info(f"Known channels from channels.txt: {len(known_channel_ids)} IDs, {len(known_channel_handles)} handles")
 
-    # Process files in parallel (3 at a time)
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        # Submit all files for processing
-        future_to_file = {
-            executor.submit(
-                _process_single_file,
-                file_info,
-                mode,
-                known_channel_ids,
-                known_channel_handles
-            ): file_info
-            for file_info in _import_state['files']
-        }
+    # Skip files already imported or awaiting review from an earlier run
+    imported_paths = _import_state.imported_paths
+    pending_by_path = _import_state.pending_by_path
+    files_to_identify = [
+        f for f in _import_state.files
+        if f['path'] not in imported_paths and f['path'] not in pending_by_path
+    ]
+    already_processed = len(_import_state.files) - len(files_to_identify)
+    if already_processed:
+        logger.info(f"Skipping {already_processed} already imported/pending files")
 
-        # Collect results as they complete
-        for future in as_completed(future_to_file):
-            file_info = future_to_file[future]
-            try:
-                result = future.result()
-                if result['type'] == 'identified':
-                    identified.append(result['data'])
-                elif result['type'] == 'pending':
-                    pending.append(result['data'])
-                else:  # failed
-                    failed.append(result['data'])
-            except Exception as e:
-                logger.error(f"Error processing {file_info['name']}: {e}")
-                failed.append({
+    # ffprobe every file up front on a wider pool (local CPU/disk work), so
+    # the YouTube-bound identify workers below never wait on a probe
+    durations = probe_durations([f['path'] for f in files_to_identify])
+
+    # Process files in parallel; ex.map keeps results in scan order.
+    # Worker count is bounded to avoid YouTube rate-limiting.
+    max_workers = min(max(_settings_manager.get_int('import_identify_workers', 3), 1), 8)
+
+    def identify_file(file_info):
+        try:
+            return _process_single_file(
+                file_info, mode, known_channel_ids, known_channel_handles,
+                local_duration=durations.get(file_info['path'])
+            )
+        except Exception as e:
+            logger.error(f"Error processing {file_info['name']}: {e}")
+            return {
+                'type': 'failed',
+                'data': {
                     'file': file_info['path'],
                     'filename': file_info['name'],
                     'file_size': file_info.get('size', 0),
                     'reason': f'Processing error: {str(e)}',
                     'reason_code': 'processing_error',
-                })
+                }
+            }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(identify_file, files_to_identify):
+            if result['type'] == 'identified':
+                identified.append(result['data'])
+            elif result['type'] == 'pending':
+                pending.append(result['data'])
+            else:  # failed
+                failed.append(result['data'])
 
     # Update import state
-    _import_state['pending'] = pending
+    # Keep earlier pending items so a re-run doesn't drop them from review
+    pending = _import_state.pending + pending
+    _set_pending(pending)
 
     return jsonify({
         'identified': identified,
         'pending': pending,
         'failed': failed,
         'summary': {
-            'total': len(_import_state['files']),
+            'total': len(_import_state.files),
             'identified': len(identified),
             'pending': len(pending),
             'failed': len(failed),
+            'already_processed': already_processed,
         }
     })
 
@@ -1517,7 +2835,6 @@ def execute_smart_import():
     """
     global _import_state
 
-    _ensure_state_keys()
 
     data = request.json
     matches = data.get('matches', [])
@@ -1528,9 +2845,13 @@ def execute_smart_import():
     results = []
     queued_for_encoding = 0
 
+    # Direct imports share one DB transaction (see ImportBatch)
+    batch = ImportBatch()
+    direct = []  # Non-MKV matches, imported concurrently after the loop
+
     # Check if MKV re-encoding is enabled
-    reencode_enabled = _settings_manager.get('import_reencode_mkv', 'false') == 'true'
-    include_mkv_override = _import_state.get('include_mkv_override', False)
+    reencode_enabled = _reencode_mkv_enabled()
+    include_mkv_override = _import_state.include_mkv_override
     allow_mkv = reencode_enabled or include_mkv_override
 
     for match in matches:
@@ -1542,9 +2863,7 @@ def execute_smart_import():
         match_type = match.get('match_type', 'smart')
 
         # Remove this file from pending list (if it was there)
-        _import_state['pending'] = [
-            p for p in _import_state['pending'] if p.get('file') != file_path
-        ]
+        _remove_pending(file_path)
 
         # Check if this is an MKV that needs encoding
         if ext == '.mkv' and allow_mkv:
@@ -1565,41 +2884,42 @@ def execute_smart_import():
                 'queued': True,  # Indicates queued for encoding, not yet imported
             })
         else:
-            # Import non-MKV files directly
-            try:
-                # Fetch full metadata before import (gets upload_date)
-                video_info = _ensure_full_metadata(video_info)
+            # Import non-MKV files directly (concurrently, below); the result
+            # is filled in place so results keep the order of matches
+            result = {'file': filename}
+            results.append(result)
+            direct.append((result, file_path, filename, video_info, channel_info, match_type))
+
+    def _import_direct(job):
+        result, file_path, filename, video_info, channel_info, match_type = job
+        try:
+            # Fetch full metadata before import (gets upload_date)
+            video_info = _ensure_full_metadata(video_info)
 
-                success, db_video_id = execute_import(
-                    file_path, video_info, channel_info, match_type
-                )
+            success, _ = execute_import(
+                file_path, video_info, channel_info, match_type, batch=batch, channels=channels
+            )
+        except Exception as e:
+            logger.error(f"Smart import error for {file_path}: {e}")
+            result.update(success=False, error=str(e))
+            return None
 
-                if success:
-                    _import_state['imported'].append({
-                        'file': file_path,
-                        'filename': filename,
-                        'video': video_info,
-                        'match_type': match_type,
-                        'channel': channel_info['channel_title'],
-                    })
-                    results.append({
-                        'file': filename,
-                        'success': True,
-                        'video_id': db_video_id,
-                    })
-                else:
-                    results.append({
-                        'file': filename,
-                        'success': False,
-                        'error': 'Import failed',
-                    })
-            except Exception as e:
-                logger.error(f"Smart import error for {file_path}: {e}")
-                results.append({
-                    'file': filename,
-                    'success': False,
-                    'error': str(e),
-                })
+        if not success:
+            result.update(success=False, error='Import failed')
+            return None
+        result.update(success=True, video_id=None)  # video_id filled in when the batch commits
+        return result, {
+            'file': file_path,
+            'filename': filename,
+            'video': video_info,
+            'match_type': match_type,
+            'channel': channel_info['channel_title'],
+        }
+
+    # Channels are looked up/created in one transaction before any file is copied
+    channels = _prefetch_import_channels([job[4] for job in direct])
+    batched = [pair for pair in _run_imports(_import_direct, direct) if pair]
+    _commit_import_batch(batch, batched)
 
     return jsonify({
         'results': results,
@@ -1620,11 +2940,11 @@ def add_channel():
         return jsonify({'error': 'Channel URL is required'}), 400
 
     # Check if already added
-    for ch in _import_state['channels']:
+    for ch in _import_state.channels:
         if ch.get('url') == url:
             return jsonify({'error': 'Channel already added'}), 400
 
-    _import_state['channels'].append({
+    _import_state.channels.append({
         'url': url,
         'channel_info': None,
         'videos': [],
@@ -1633,7 +2953,7 @@ def add_channel():
 
     return jsonify({
         'success': True,
-        'channels': _import_state['channels'],
+        'channels': _import_state.channels,
     })
 
 
@@ -1645,12 +2965,13 @@ def set_channels():
     data = request.json
     urls = data.get('urls', [])
 
-    _import_state['channels'] = []
+    _import_state.channels = []
+    _import_state.channel_indexes = {}
 
     for url in urls:
         url = url.strip()
         if url and not url.startswith('#'):
-            _import_state['channels'].append({
+            _import_state.channels.append({
                 'url': url,
                 'channel_info': None,
                 'videos': [],
@@ -1659,10 +2980,19 @@ def set_channels():
 
     return jsonify({
         'success': True,
-        'channels': _import_state['channels'],
+        'channels': _import_state.channels,
     })
 
 
+def _requested_max_videos(data):
+    """Optional max_videos limit from a request body (positive int), else None."""
+    try:
+        value = int(data.get('max_videos') or 0)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
 @import_bp.route('/api/import/fetch-channel', methods=['POST'])
 def fetch_channel():
     """Fetch video metadata from a channel."""
@@ -1671,15 +3001,15 @@ def fetch_channel():
     data = request.json
     channel_idx = data.get('channel_idx', 0)
 
-    if channel_idx >= len(_import_state['channels']):
+    if channel_idx >= len(_import_state.channels):
         return jsonify({'error': 'Invalid channel index'}), 400
 
-    channel = _import_state['channels'][channel_idx]
+    channel = _import_state.channels[channel_idx]
     channel['status'] = 'fetching'
-    _import_state['status'] = 'fetching'
-    _import_state['message'] = f"Fetching metadata for channel..."
+    _import_state.status = 'fetching'
+    _import_state.message = f"Fetching metadata for channel..."
 
-    result, error = fetch_channel_videos_ytdlp(channel['url'])
+    result, error = fetch_channel_videos_ytdlp(channel['url'], _requested_max_videos(data))
 
     if error:
         channel['status'] = 'error'
@@ -1689,9 +3019,10 @@ def fetch_channel():
     channel['channel_info'] = result['channel_info']
     channel['videos'] = result['videos']
     channel['status'] = 'ready'
+    _import_state.channel_indexes[channel['url']] = build_channel_index(result['videos'])
 
-    _import_state['status'] = 'idle'
-    _import_state['message'] = ''
+    _import_state.status = 'idle'
+    _import_state.message = ''
 
     return jsonify({
         'success': True,
@@ -1700,6 +3031,51 @@ def fetch_channel():
     })
 
 
+@import_bp.route('/api/import/fetch-channels', methods=['POST'])
+def fetch_channels():
+    """Fetch video metadata for every channel not yet fetched, in parallel."""
+    global _import_state
+
+    data = request.get_json(silent=True) or {}
+    to_fetch = [ch for ch in _import_state.channels if ch.get('status') != 'ready']
+    if not to_fetch:
+        return jsonify({'success': True, 'channels': []})
+
+    for channel in to_fetch:
+        channel['status'] = 'fetching'
+    _import_state.status = 'fetching'
+    _import_state.message = f"Fetching metadata for {len(to_fetch)} channels..."
+
+    results = fetch_channels_parallel([ch['url'] for ch in to_fetch], _requested_max_videos(data))
+
+    summary = []
+    for channel in to_fetch:
+        result, error = results[channel['url']]
+        if error:
+            channel['status'] = 'error'
+            channel['error'] = error
+        else:
+            channel['channel_info'] = result['channel_info']
+            channel['videos'] = result['videos']
+            channel['status'] = 'ready'
+            _import_state.channel_indexes[channel['url']] = build_channel_index(result['videos'])
+        summary.append({
+            'url': channel['url'],
+            'status': channel['status'],
+            'error': error,
+            'channel_info': channel.get('channel_info'),
+            'video_count': len(channel.get('videos', [])),
+        })
+
+    _import_state.status = 'idle'
+    _import_state.message = ''
+
+    return jsonify({
+        'success': True,
+        'channels': summary,
+    })
+
+
 @import_bp.route('/api/import/match', methods=['POST'])
 def match_files():
     """Match files against channel videos."""
@@ -1708,23 +3084,23 @@ def match_files():
     data = request.json
     channel_idx = data.get('channel_idx', 0)
 
-    if channel_idx >= len(_import_state['channels']):
+    if channel_idx >= len(_import_state.channels):
         return jsonify({'error': 'Invalid channel index'}), 400
 
-    channel = _import_state['channels'][channel_idx]
+    channel = _import_state.channels[channel_idx]
 
     if not channel.get('videos'):
         return jsonify({'error': 'Channel videos not fetched'}), 400
 
-    _import_state['status'] = 'matching'
-    _import_state['message'] = 'Matching files...'
+    _import_state.status = 'matching'
+    _import_state.message = 'Matching files...'
 
     # Get remaining files (not yet imported or pending)
-    imported_files = {item['file'] for item in _import_state['imported']}
-    pending_files = {item['file'] for item in _import_state['pending']}
+    imported_files = _import_state.imported_paths
+    pending_files = _import_state.pending_by_path
 
     remaining_files = [
-        f for f in _import_state['files']
+        f for f in _import_state.files
         if f['path'] not in imported_files and f['path'] not in pending_files
     ]
 
@@ -1732,16 +3108,18 @@ def match_files():
     new_pending = []
     new_skipped = []
 
+    # Probe all local durations up front instead of one ffprobe at a time
+    durations = probe_durations([f['path'] for f in remaining_files])
+    index = _channel_index(channel)
+
     for file_info in remaining_files:
         file_path = file_info['path']
         filename = file_info['name']
-
-        # Get local duration
-        local_duration = get_video_duration(file_path)
+        local_duration = durations[file_path]
 
         # Find matches
         matched_videos, match_type = find_match(
-            file_path, filename, local_duration, channel['videos']
+            file_path, filename, local_duration, index, stem=file_info.get('stem')
         )
 
         if len(matched_videos) == 1:
@@ -1764,9 +3142,9 @@ def match_files():
             })
         # If no match, don't add to skipped yet - might match another channel
 
-    _import_state['pending'].extend(new_pending)
-    _import_state['status'] = 'idle'
-    _import_state['message'] = ''
+    _add_pending(new_pending)
+    _import_state.status = 'idle'
+    _import_state.message = ''
 
     return jsonify({
         'matches': matches,
@@ -1787,55 +3165,65 @@ def execute_imports():
     if not matches:
         return jsonify({'error': 'No matches to import'}), 400
 
-    _import_state['status'] = 'importing'
+    _import_state.status = 'importing'
 
-    results = []
+    # All imports share one DB transaction (see ImportBatch)
+    batch = ImportBatch()
 
-    for match in matches:
+    def _import_match(match):
         file_path = match['file']
         video_info = match['video']
         channel_idx = match['channel_idx']
         match_type = match['match_type']
 
-        channel = _import_state['channels'][channel_idx]
+        channel = _import_state.channels[channel_idx]
         channel_info = channel['channel_info']
 
-        _import_state['message'] = f"Importing: {video_info['title'][:50]}..."
+        _import_state.message = f"Importing: {(video_info.get('title') or match['filename'])[:50]}..."
 
         try:
-            success, video_id = execute_import(
-                file_path, video_info, channel_info, match_type
+            success, _ = execute_import(
+                file_path, video_info, channel_info, match_type, batch=batch, channels=channels
             )
-
-            if success:
-                _import_state['imported'].append({
-                    'file': file_path,
-                    'filename': match['filename'],
-                    'video': video_info,
-                    'match_type': match_type,
-                    'channel': channel_info['channel_title'],
-                })
-                results.append({
-                    'file': match['filename'],
-                    'success': True,
-                    'video_id': video_id,
-                })
-            else:
-                results.append({
-                    'file': match['filename'],
-                    'success': False,
-                    'error': 'Import failed',
-                })
         except Exception as e:
             logger.error(f"Import error for {file_path}: {e}")
-            results.append({
+            return {
                 'file': match['filename'],
                 'success': False,
                 'error': str(e),
-            })
+            }, None
+
+        if not success:
+            return {
+                'file': match['filename'],
+                'success': False,
+                'error': 'Import failed',
+            }, None
+        result = {
+            'file': match['filename'],
+            'success': True,
+            'video_id': None,  # Filled in when the batch commits
+        }
+        return result, {
+            'file': file_path,
+            'filename': match['filename'],
+            'video': video_info,
+            'match_type': match_type,
+            'channel': channel_info['channel_title'],
+        }
+
+    # Channels are looked up/created in one transaction before any file is copied
+    channels = _prefetch_import_channels([
+        _import_state.channels[match['channel_idx']]['channel_info']
+        for match in matches
+        if 0 <= match['channel_idx'] < len(_import_state.channels)
+    ])
+    outcomes = _run_imports(_import_match, matches)
+    results = [result for result, _ in outcomes]
+    _commit_import_batch(batch, [(result, entry) for result, entry in outcomes if entry])
 
-    _import_state['status'] = 'idle'
-    _import_state['message'] = ''
+    _import_state.status = 'idle'
+    _import_state.message = ''
 
     return jsonify({
         'results': results,
@@ -1857,43 +3245,33 @@ def resolve_pending():
         return jsonify({'error': 'File path is required'}), 400
 
     # Find the pending item
-    pending_item = None
-    pending_idx = None
-    for idx, item in enumerate(_import_state['pending']):
-        if item['file'] == file_path:
-            pending_item = item
-            pending_idx = idx
-            break
+    pending_item = _import_state.pending_by_path.get(file_path)
 
     if not pending_item:
         return jsonify({'error': 'Pending item not found'}), 404
 
     if skip:
         # User chose to skip
-        _import_state['skipped'].append({
+        _import_state.skipped.append({
             'file': file_path,
             'filename': pending_item['filename'],
             'reason': 'User skipped',
         })
-        _import_state['pending'].pop(pending_idx)
+        _remove_pending(file_path)
         return jsonify({'success': True, 'action': 'skipped'})
 
     if not video_id:
         return jsonify({'error': 'video_id is required unless skipping'}), 400
 
     # Find the selected video
-    selected_video = None
-    for video in pending_item['matches']:
-        if video['id'] == video_id:
-            selected_video = video
-            break
+    selected_video = next((v for v in pending_item['matches'] if v['id'] == video_id), None)
 
-    if not selected_video:
+    if selected_video is None:
         return jsonify({'error': 'Selected video not found in matches'}), 400
 
     # Execute import
     channel_idx = pending_item['channel_idx']
-    channel = _import_state['channels'][channel_idx]
+    channel = _import_state.channels[channel_idx]
     channel_info = channel['channel_info']
 
     try:
@@ -1902,14 +3280,14 @@ def resolve_pending():
         )
 
         if success:
-            _import_state['imported'].append({
+            _record_imported({
                 'file': file_path,
                 'filename': pending_item['filename'],
                 'video': selected_video,
                 'match_type': 'user_selected',
                 'channel': channel_info['channel_title'],
             })
-            _import_state['pending'].pop(pending_idx)
+            _remove_pending(file_path)
             return jsonify({'success': True, 'action': 'imported', 'video_id': db_video_id})
         else:
             return jsonify({'error': 'Import failed'}), 500
@@ -1924,21 +3302,24 @@ def skip_remaining():
     """Skip all remaining unmatched files."""
     global _import_state
 
-    # Get all file paths that have been processed
-    imported_files = {item['file'] for item in _import_state['imported']}
-    pending_files = {item['file'] for item in _import_state['pending']}
-    skipped_files = {item['file'] for item in _import_state['skipped']}
+    state = _import_state
 
-    processed = imported_files | pending_files | skipped_files
+    # Processed paths are checked against the kept-in-sync lookups directly,
+    # rather than copying them into one union set first
+    imported_files = state.imported_paths
+    pending_files = state.pending_by_path
+    skipped_files = {item['file'] for item in state.skipped}
 
     # Find unprocessed files
-    for file_info in _import_state['files']:
-        if file_info['path'] not in processed:
-            _import_state['skipped'].append({
-                'file': file_info['path'],
+    for file_info in state.files:
+        path = file_info['path']
+        if path not in imported_files and path not in pending_files and path not in skipped_files:
+            state.skipped.append({
+                'file': path,
                 'filename': file_info['name'],
                 'reason': 'No match found in any channel',
             })
+    _notify_state_changed()
 
     return jsonify({'success': True})
 
@@ -1955,22 +3336,16 @@ def skip_pending_item():
         return jsonify({'error': 'file path is required'}), 400
 
     # Find and remove from pending
-    pending_item = None
-    for item in _import_state['pending']:
-        if item.get('file') == file_path:
-            pending_item = item
-            break
+    pending_item = _import_state.pending_by_path.get(file_path)
 
     if not pending_item:
         return jsonify({'error': 'Pending item not found'}), 404
 
     # Remove from pending
-    _import_state['pending'] = [
-        p for p in _import_state['pending'] if p.get('file') != file_path
-    ]
+    _remove_pending(file_path)
 
     # Add to skipped
-    _import_state['skipped'].append({
+    _import_state.skipped.append({
         'file': file_path,
         'filename': pending_item.get('filename', os.path.basename(file_path)),
         'file_size': pending_item.get('file_size', 0),
@@ -1980,38 +3355,125 @@ def skip_pending_item():
 
     return jsonify({
         'success': True,
-        'pending_count': len(_import_state['pending']),
-        'skipped_count': len(_import_state['skipped']),
+        'pending_count': len(_import_state.pending),
+        'skipped_count': len(_import_state.skipped),
     })
 
 
-@import_bp.route('/api/import/state', methods=['GET'])
-def get_state():
-    """Get current import state."""
-    global _import_state
+# summary flag -> (fingerprint, body, etag) of the last /api/import/state response
+_state_response_cache = {}
 
-    return jsonify({
-        'status': _import_state['status'],
-        'message': _import_state['message'],
-        'encode_progress': _import_state.get('encode_progress'),
+# Result lists that /api/import/state/details can page through
+STATE_DETAIL_SECTIONS = ('imported', 'pending', 'skipped', 'failed', 'files')
+STATE_DETAIL_MAX_LIMIT = 1000
+
+
+def _state_fingerprint(state):
+    """Cheap summary of everything get_state() serializes.
+
+    Result lists are only appended to, removed from or replaced wholesale,
+    and channel dicts change together with their status, so list identity,
+    length and last entry are enough to tell that the state has changed.
+    """
+    lists = (state.files, state.imported, state.pending, state.skipped, state.failed)
+    return (
+        id(state), state.status, state.message, state.encode_progress,
+        id(state.encode_current), _encode_queue.qsize(),
+        tuple((id(ch), ch.get('status'), len(ch.get('videos', ()))) for ch in state.channels),
+        tuple((id(lst), len(lst), id(lst[-1]) if lst else None) for lst in lists),
+    )
+
+
+def _state_payload(state, summary):
+    """Build the /api/import/state body; summary leaves out the result lists."""
+    payload = {
+        'status': state.status,
+        'message': state.message,
+        'encode_progress': state.encode_progress,
         'channels': [{
             'url': ch['url'],
             'channel_info': ch.get('channel_info'),
             'video_count': len(ch.get('videos', [])),
             'status': ch.get('status', 'pending'),
-        } for ch in _import_state['channels']],
-        'files': _import_state['files'],
-        'file_count': len(_import_state['files']),
-        'imported_count': len(_import_state['imported']),
-        'pending_count': len(_import_state['pending']),
-        'skipped_count': len(_import_state['skipped']),
-        'failed_count': len(_import_state.get('failed', [])),
-        'imported': _import_state['imported'],
-        'pending': _import_state['pending'],
-        'skipped': _import_state['skipped'],
-        'failed': _import_state.get('failed', []),
-        'encode_queue_count': len(_import_state.get('encode_queue', [])),
-        'encode_current': _import_state.get('encode_current'),
+        } for ch in state.channels],
+        'file_count': len(state.files),
+        'imported_count': len(state.imported),
+        'pending_count': len(state.pending),
+        'skipped_count': len(state.skipped),
+        'failed_count': len(state.failed),
+        'encode_queue_count': _encode_queue.qsize(),
+        'encode_current': state.encode_current,
+    }
+    if not summary:
+        payload.update(
+            files=state.files,
+            imported=state.imported,
+            pending=state.pending,
+            skipped=state.skipped,
+            failed=state.failed,
+        )
+    return payload
+
+
+@import_bp.route('/api/import/state', methods=['GET'])
+def get_state():
+    """Get current import state.
+
+    Query params:
+        summary: If true, return only status and counts without the
+            imported/pending/skipped/failed/files lists (page through those
+            with /api/import/state/details instead)
+
+    Responses carry a content ETag; polls with a matching If-None-Match
+    get an empty 304 instead of the full imported/pending/skipped lists.
+    The encoded body is reused until the state's fingerprint changes, so
+    polling an idle import doesn't re-serialize the lists every time.
+    """
+    global _import_state
+
+    summary = request.args.get('summary', 'false').lower() == 'true'
+    fingerprint = _state_fingerprint(_import_state)
+    cached = _state_response_cache.get(summary)
+    if cached is not None and cached[0] == fingerprint:
+        response = Response(cached[1], mimetype='application/json')
+        response.set_etag(cached[2])
+        response.headers['Cache-Control'] = 'no-cache'  # Always revalidate, never serve stale
+        return response.make_conditional(request)
+
+    response = jsonify(_state_payload(_import_state, summary))
+    response.add_etag()
+    _state_response_cache[summary] = (fingerprint, response.get_data(), response.get_etag()[0])
+    response.headers['Cache-Control'] = 'no-cache'  # Always revalidate, never serve stale
+    return response.make_conditional(request)
+
+
+@import_bp.route('/api/import/state/details', methods=['GET'])
+def get_state_details():
+    """Page through one of the import state's result lists.
+
+    Query params:
+        section: One of imported, pending, skipped, failed, files
+        offset: Index of the first item to return (default 0)
+        limit: Maximum number of items to return (default 200, max 1000)
+    """
+    global _import_state
+
+    section = request.args.get('section', 'imported')
+    if section not in STATE_DETAIL_SECTIONS:
+        return jsonify({'error': f"Invalid section: {section}"}), 400
+    try:
+        offset = max(0, int(request.args.get('offset', 0)))
+        limit = min(STATE_DETAIL_MAX_LIMIT, max(1, int(request.args.get('limit', 200))))
+    except ValueError:
+        return jsonify({'error': 'offset and limit must be integers'}), 400
+
+    items = getattr(_import_state, section)
+    return jsonify({
+        'section': section,
+        'total': len(items),
+        'offset': offset,
+        'limit': limit,
+        'items': items[offset:offset + limit],
     })
 
 
@@ -2020,12 +3482,12 @@ def get_encode_status():
     """Get encoding queue status for frontend polling."""
     global _import_state
 
-    _ensure_state_keys()
 
     with _encode_lock:
-        encode_current = _import_state.get('encode_current')
-        encode_queue = _import_state.get('encode_queue', [])
-        encode_progress = _import_state.get('encode_progress', 0)
+        encode_current = _import_state.encode_current
+        with _encode_queue.mutex:
+            encode_queue = list(_encode_queue.queue)
+        encode_progress = _import_state.encode_progress
 
         return jsonify({
             'encoding': encode_current is not None,
@@ -2045,16 +3507,51 @@ def get_encode_status():
 @import_bp.route('/api/import/allowed-extensions', methods=['GET'])
 def get_allowed_extensions():
     """Return currently allowed video extensions based on settings."""
-    reencode_mkv = _settings_manager.get('import_reencode_mkv', 'false') == 'true'
-    extensions = list(VIDEO_EXTENSIONS)
-    if reencode_mkv:
-        extensions.append(MKV_EXTENSION)
+    reencode_mkv = _reencode_mkv_enabled()
+    extensions = _ALLOWED_WITH_MKV if reencode_mkv else VIDEO_EXTENSIONS
     return jsonify({
         'extensions': sorted(extensions),
         'reencode_mkv': reencode_mkv
     })
 
 
+@import_bp.route('/api/import/clear-search-cache', methods=['POST'])
+def clear_search_cache():
+    """Clear cached YouTube search results used by smart identify."""
+    removed = lookup_cache.clear(SEARCH_CACHE_NAMESPACE)
+    logger.info(f"Cleared {removed} cached import searches")
+    return jsonify({'success': True, 'cleared': removed})
+
+
+@import_bp.route('/api/import/cache/clear', methods=['POST'])
+def clear_import_cache():
+    """Clear cached yt-dlp lookups.
+
+    JSON body (optional):
+        type: 'search', 'channel', 'video', 'resolve' or 'duration' - omit to clear all
+    """
+    data = request.get_json(silent=True) or {}
+    cache_type = data.get('type')
+
+    if cache_type is None:
+        namespaces = list(IMPORT_CACHE_NAMESPACES.values())
+        _resolve_channel_id_ytdlp.cache_clear()
+        _duration_cache.clear()
+        _channel_thumbnail_attempted.clear()
+    elif cache_type in IMPORT_CACHE_NAMESPACES:
+        namespaces = [IMPORT_CACHE_NAMESPACES[cache_type]]
+        if cache_type == 'resolve':
+            _resolve_channel_id_ytdlp.cache_clear()
+        elif cache_type == 'duration':
+            _duration_cache.clear()
+    else:
+        return jsonify({'error': f'Unknown cache type: {cache_type}'}), 400
+
+    removed = sum(lookup_cache.clear(namespace) for namespace in namespaces)
+    logger.info(f"Cleared {removed} cached import lookups ({cache_type or 'all'})")
+    return jsonify({'success': True, 'cleared': removed})
+
+
 @import_bp.route('/api/import/reset', methods=['POST'])
 def reset_state():
     """Reset import state.
@@ -2068,52 +3565,16 @@ def reset_state():
     force = data.get('force', False)
 
     if force:
-        # Full reset - clears everything including encoding
-        _import_state = {
-            'channels': [],
-            'files': [],
-            'pending': [],
-            'imported': [],
-            'skipped': [],
-            'failed': [],
-            'known_channel_ids': set(),
-            'known_channel_handles': set(),
-            'current_channel_idx': 0,
-            'status': 'idle',
-            'progress': 0,
-            'message': '',
-            'encode_progress': None,
-            'encode_queue': [],
-            'encode_current': None,
-        }
+        # Full reset - clears everything including queued encodes
+        _clear_encode_queue()
+        _created_channel_folders.clear()
+        _channel_thumbnail_attempted.clear()
+        _import_state = ImportState()
         return jsonify({'success': True, 'encoding_preserved': False, 'force_reset': True})
 
     # Preserve encoding state if encoding is in progress
-    with _encode_lock:
-        encoding_in_progress = _import_state.get('encode_current') is not None or len(_import_state.get('encode_queue', [])) > 0
-        preserved_encode_queue = _import_state.get('encode_queue', []) if encoding_in_progress else []
-        preserved_encode_current = _import_state.get('encode_current') if encoding_in_progress else None
-        preserved_encode_progress = _import_state.get('encode_progress', 0) if encoding_in_progress else None
-        preserved_imported = _import_state.get('imported', []) if encoding_in_progress else []
-        preserved_failed = _import_state.get('failed', []) if encoding_in_progress else []
-        preserved_status = _import_state.get('status', 'idle') if encoding_in_progress else 'idle'
-
-    _import_state = {
-        'channels': [],
-        'files': [],
-        'pending': [],
-        'imported': preserved_imported,
-        'skipped': [],
-        'failed': preserved_failed,
-        'known_channel_ids': set(),
-        'known_channel_handles': set(),
-        'current_channel_idx': 0,
-        'status': preserved_status,
-        'progress': 0,
-        'message': '',
-        'encode_progress': preserved_encode_progress,
-        'encode_queue': preserved_encode_queue,
-        'encode_current': preserved_encode_current,
-    }
+    _import_state, encoding_in_progress = _fresh_import_state()
+    _created_channel_folders.clear()
+    _channel_thumbnail_attempted.clear()
 
     return jsonify({'success': True, 'encoding_preserved': encoding_in_progress})
@@ -13,8 +13,10 @@ Handles:
 """
 
 from flask import Blueprint, jsonify, request
-from sqlalchemy.orm import joinedload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 import logging
+import os
 
 from database import Category, Playlist, PlaylistVideo, Video, get_session
 
@@ -30,6 +32,12 @@ _serialize_category = None
 _serialize_playlist = None
 _serialize_video = None
 
+# Set STRICT_LOADING=true to make library reads raise when a serializer touches
+# a relationship the query didn't eager-load and that would need its own SELECT
+# (identity-map hits, like a playlist's already-loaded category, are allowed).
+# Used during development to find N+1 queries hidden in the serializers.
+STRICT_LOADING = os.environ.get('STRICT_LOADING', 'false').lower() == 'true'
+
 
 def init_library_routes(session_factory, limiter, serialize_category, serialize_playlist, serialize_video):
     """Initialize the library routes with required dependencies."""
@@ -41,6 +49,13 @@ def init_library_routes(session_factory, limiter, serialize_category, serialize_
     _serialize_video = serialize_video
 
 
+def _read_options(*options):
+    """Eager-load options for a library read, plus raiseload('*') in strict mode."""
+    if STRICT_LOADING:
+        return options + (raiseload('*', sql_only=True),)
+    return options
+
+
 # =============================================================================
 # Category Endpoints (Playlist Categories)
 # =============================================================================
@@ -49,9 +64,12 @@ def init_library_routes(session_factory, limiter, serialize_category, serialize_
 def get_categories():
     """List all categories with playlist counts"""
     with get_session(_session_factory) as session:
-        categories = session.query(Category).options(
-            joinedload(Category.playlists).joinedload(Playlist.playlist_videos)
-        ).order_by(Category.name).all()
+        # selectinload: one IN query per level instead of a category x playlist x video JOIN.
+        # The videos (and their channels) feed the serializers' random thumbnail.
+        categories = session.query(Category).options(*_read_options(
+            selectinload(Category.playlists).selectinload(Playlist.playlist_videos)
+            .selectinload(PlaylistVideo.video).joinedload(Video.channel)
+        )).order_by(Category.name).all()
         result = [_serialize_category(c) for c in categories]
         return jsonify(result)
 
@@ -82,9 +100,10 @@ def create_category():
 def get_category(category_id):
     """Get single category with its playlists"""
     with get_session(_session_factory) as session:
-        category = session.query(Category).options(
-            joinedload(Category.playlists).joinedload(Playlist.playlist_videos)
-        ).filter(Category.id == category_id).first()
+        category = session.query(Category).options(*_read_options(
+            selectinload(Category.playlists).selectinload(Playlist.playlist_videos)
+            .selectinload(PlaylistVideo.video).joinedload(Video.channel)
+        )).filter(Category.id == category_id).first()
 
         if not category:
             return jsonify({'error': 'Category not found'}), 404
@@ -160,13 +179,10 @@ def bulk_assign_category():
             if not category:
                 return jsonify({'error': 'Category not found'}), 404
 
-        # Update all playlists
-        updated_count = 0
-        for playlist_id in playlist_ids:
-            playlist = session.query(Playlist).filter(Playlist.id == playlist_id).first()
-            if playlist:
-                playlist.category_id = category_id
-                updated_count += 1
+        # Update all playlists in one statement
+        updated_count = session.query(Playlist).filter(
+            Playlist.id.in_(playlist_ids)
+        ).update({Playlist.category_id: category_id}, synchronize_session=False)
 
         session.commit()
 
@@ -185,10 +201,10 @@ def get_playlists():
     with get_session(_session_factory) as session:
         channel_id = request.args.get('channel_id', type=int)
 
-        query = session.query(Playlist).options(
+        query = session.query(Playlist).options(*_read_options(
             joinedload(Playlist.category),
-            joinedload(Playlist.playlist_videos)
-        )
+            selectinload(Playlist.playlist_videos).selectinload(PlaylistVideo.video).joinedload(Video.channel)
+        ))
         if channel_id:
             query = query.filter(Playlist.channel_id == channel_id)
 
@@ -217,10 +233,16 @@ def create_playlist():
 @library_bp.route('/api/playlists/<int:playlist_id>', methods=['GET'])
 def get_playlist(playlist_id):
     with get_session(_session_factory) as session:
-        playlist = session.query(Playlist).options(
+        # selectinload per collection level: nested joinedloads multiplied each
+        # video row by every playlist it belongs to. Video.channel is many-to-one
+        # and needed by serialize_video, so it rides along on the video query.
+        playlist = session.query(Playlist).options(*_read_options(
             joinedload(Playlist.category),
-            joinedload(Playlist.playlist_videos).joinedload(PlaylistVideo.video).joinedload(Video.playlist_videos).joinedload(PlaylistVideo.playlist)
-        ).filter(Playlist.id == playlist_id).first()
+            selectinload(Playlist.playlist_videos).selectinload(PlaylistVideo.video).options(
+                joinedload(Video.channel),
+                selectinload(Video.playlist_videos).joinedload(PlaylistVideo.playlist),
+            )
+        )).filter(Playlist.id == playlist_id).first()
 
         if not playlist:
             return jsonify({'error': 'Playlist not found'}), 404
@@ -277,17 +299,13 @@ def add_video_to_playlist(playlist_id):
 
         video_id = data['video_id']
 
-        # Check if already added
-        existing = session.query(PlaylistVideo).filter(
-            PlaylistVideo.playlist_id == playlist_id,
-            PlaylistVideo.video_id == video_id
-        ).first()
-
-        if existing:
+        # The unique (playlist_id, video_id) index rejects duplicates atomically
+        result = session.execute(
+            sqlite_insert(PlaylistVideo).values(playlist_id=playlist_id, video_id=video_id).on_conflict_do_nothing()
+        )
+        if result.rowcount == 0:
             return jsonify({'error': 'Video already in playlist'}), 400
 
-        pv = PlaylistVideo(playlist_id=playlist_id, video_id=video_id)
-        session.add(pv)
         session.commit()
 
         return jsonify({'success': True}), 201
@@ -313,35 +331,31 @@ def add_videos_to_playlist_bulk(playlist_id):
 
         logger.debug(f"Bulk add to playlist '{playlist.name}' (ID: {playlist_id}): {len(video_ids)} videos")
 
-        added_count = 0
-        skipped_count = 0
+        try:
+            requested_ids = {int(video_id) for video_id in video_ids}
+        except (TypeError, ValueError):
+            return jsonify({'error': 'video_ids must be integers'}), 400
 
-        for video_id in video_ids:
-            # Check if already in playlist
-            existing = session.query(PlaylistVideo).filter(
-                PlaylistVideo.playlist_id == playlist_id,
-                PlaylistVideo.video_id == video_id
-            ).first()
+        valid_ids = {video_id for (video_id,) in session.query(Video.id).filter(Video.id.in_(requested_ids))}
 
-            if existing:
-                logger.debug(f"Bulk add: Skipping video ID {video_id} - already in playlist")
-                skipped_count += 1
-                continue
-
-            # Get video for logging
-            video = session.query(Video).filter(Video.id == video_id).first()
-            if not video:
-                logger.debug(f"Bulk add: Skipping non-existent video ID: {video_id}")
-                skipped_count += 1
-                continue
-
-            # Add to playlist
-            pv = PlaylistVideo(playlist_id=playlist_id, video_id=video_id)
-            session.add(pv)
-            added_count += 1
-            logger.debug(f"Bulk add: Added video '{video.title}' (ID: {video_id}) to playlist")
+        # Keep request order; videos already in the playlist are skipped by the
+        # unique (playlist_id, video_id) index, and count as skipped with
+        # duplicate and unknown IDs
+        to_add = []
+        for video_id in video_ids:
+            video_id = int(video_id)
+            if video_id in valid_ids:
+                to_add.append({'playlist_id': playlist_id, 'video_id': video_id})
+                valid_ids.discard(video_id)
 
+        added_count = 0
+        if to_add:
+            # Table-level insert so executemany reports the inserted rowcount
+            result = session.execute(sqlite_insert(PlaylistVideo.__table__).on_conflict_do_nothing(), to_add)
+            added_count = result.rowcount
         session.commit()
+
+        skipped_count = len(video_ids) - added_count
         logger.info(f"Bulk add to playlist completed: {added_count} added, {skipped_count} skipped")
 
         response = {
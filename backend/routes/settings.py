@@ -801,12 +801,13 @@ def fix_sponsorblock_chapters():
             # Get video duration for the final chapter
             try:
                 duration_result = subprocess.run(
-                    ['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', file_path],
+                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                     '-of', 'default=noprint_wrappers=1:nokey=1', file_path],
                     capture_output=True,
                     text=True,
                     timeout=10
                 )
-                duration = float(json_module.loads(duration_result.stdout).get('format', {}).get('duration', 0))
+                duration = float(duration_result.stdout.strip())
             except:
                 duration = video.duration_sec or 0
 
@@ -7,9 +7,12 @@ import logging.handlers
 import os
 import random
 import re
+import shutil
 import time
 import threading
-import urllib.request
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
 from database import init_db, Setting
 from werkzeug.security import check_password_hash, generate_password_hash
 
@@ -20,7 +23,36 @@ from werkzeug.security import check_password_hash, generate_password_hash
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session so thumbnail downloads reuse TCP/TLS connections
+# instead of a new handshake (and DNS lookup) per image
+thumbnail_session = requests.Session()
+for _scheme in ('https://', 'http://'):
+    thumbnail_session.mount(_scheme, HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=2))
 
+
+def save_response_atomic(response, save_path):
+    """Stream a requests response body to save_path without leaving partial files.
+
+    The body goes to a temp file in the same folder, which is renamed into
+    place only once fully written; on any error the temp file is removed and
+    the exception re-raised, so save_path is either complete or untouched.
+    """
+    # Per-thread name: parallel imports may fetch the same thumbnail at once
+    tmp_path = f'{save_path}.{os.getpid()}.{threading.get_ident()}.part'
+    try:
+        response.raw.decode_content = True
+        with open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, length=64 * 1024)
+        os.replace(tmp_path, save_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=256)
 def sanitize_folder_name(name, max_length=50):
     """Sanitize a string for use as a folder name on all platforms.
 
@@ -98,7 +130,10 @@ def download_thumbnail(url, save_path):
         return False
     try:
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        urllib.request.urlretrieve(url, save_path)
+        with thumbnail_session.get(url, timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                return False
+            save_response_atomic(response, save_path)
         return True
     except Exception:
         return False